@@ -2,21 +2,18 @@
 
 import argparse
 import logging
+import os
+import stat
 import sys
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 
-from chatweave.io.ir_writer import (
-    write_conversation_ir,
-    write_qa_unit_ir,
-    write_session_ir,
-)
-from chatweave.models.conversation import Platform
-from chatweave.parsers.unified import UnifiedParser
-from chatweave.pipeline.build_qa_ir import build_qa_ir
-from chatweave.pipeline.build_session_ir import build_session_ir
-from chatweave.util.logging_config import setup_logging
-from chatweave.util.progress import ProgressTracker
+if TYPE_CHECKING:
+    from chatweave.models.conversation import ConversationIR, Platform
+    from chatweave.models.qa_unit import QAUnitIR
+
+# Parsing/pipeline/writer modules are imported inside the functions that use
+# them so that `chatweave --help` and argument errors return quickly.
 
 
 def _collect_jsonl_files(inputs: List[Path]) -> List[Path]:
@@ -34,20 +31,29 @@ def _collect_jsonl_files(inputs: List[Path]) -> List[Path]:
     jsonl_files = []
 
     for input_path in inputs:
-        input_path = input_path.resolve()
+        if not input_path.is_absolute():
+            input_path = input_path.resolve()
 
-        if not input_path.exists():
+        # Single stat() call instead of separate exists/is_file/is_dir probes
+        try:
+            mode = os.stat(input_path).st_mode
+        except OSError:
             print(f"Error: Path not found: {input_path}", file=sys.stderr)
             sys.exit(1)
 
-        if input_path.is_file():
+        if stat.S_ISREG(mode):
             if input_path.suffix == ".jsonl":
                 jsonl_files.append(input_path)
             else:
                 print(f"Error: Not a JSONL file: {input_path}", file=sys.stderr)
                 sys.exit(1)
-        elif input_path.is_dir():
-            dir_files = list(input_path.glob("*.jsonl"))
+        elif stat.S_ISDIR(mode):
+            with os.scandir(input_path) as entries:
+                dir_files = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".jsonl") and entry.is_file()
+                ]
             if not dir_files:
                 print(f"Error: No JSONL files found in {input_path}", file=sys.stderr)
                 sys.exit(1)
@@ -63,8 +69,148 @@ def _collect_jsonl_files(inputs: List[Path]) -> List[Path]:
     return jsonl_files
 
 
+# Lazily created per process and shared across files parsed by that process
+_parser = None
+_extractor = None
+
+
+def _parse_and_build(
+    jsonl_path: Path, platform_override: Optional["Platform"] = None
+) -> Tuple["ConversationIR", "QAUnitIR"]:
+    """Parse a JSONL file and build its QAUnitIR.
+
+    Top-level so it can be dispatched to worker processes.
+
+    Args:
+        jsonl_path: Path to JSONL file
+        platform_override: Optional platform override
+
+    Returns:
+        Tuple of (ConversationIR, QAUnitIR)
+    """
+    from chatweave.pipeline.build_qa_ir import build_qa_ir
+
+    global _parser, _extractor
+    if _parser is None:
+        from chatweave.extractors.heuristic import HeuristicQueryExtractor
+        from chatweave.parsers.unified import UnifiedParser
+
+        _parser = UnifiedParser()
+        _extractor = HeuristicQueryExtractor()
+
+    conversation_ir = _parser.parse(jsonl_path, platform_override)
+    return conversation_ir, build_qa_ir(conversation_ir, _extractor)
+
+
+def _parse_files(
+    jsonl_files: List[Path],
+    platform_override: Optional["Platform"] = None,
+    jobs: Optional[int] = None,
+) -> Iterator[Tuple["ConversationIR", "QAUnitIR"]]:
+    """Parse JSONL files, in parallel worker processes when worthwhile.
+
+    Results are yielded in input order regardless of completion order.
+
+    Args:
+        jsonl_files: JSONL file paths to parse
+        platform_override: Optional platform override applied to every file
+        jobs: Maximum worker processes (default: CPU count)
+
+    Returns:
+        Iterator of (ConversationIR, QAUnitIR) tuples
+    """
+    workers = min(jobs or os.cpu_count() or 1, len(jsonl_files))
+    if workers <= 1:
+        for jsonl_path in jsonl_files:
+            yield _parse_and_build(jsonl_path, platform_override)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            _parse_and_build, jsonl_files, [platform_override] * len(jsonl_files)
+        )
+
+
+def _write_conversation_irs(
+    conversation_irs: List["ConversationIR"],
+    output_dir: Path,
+    indent: Optional[int] = None,
+    max_workers: int = 8,
+) -> List[Path]:
+    """Write ConversationIR files concurrently.
+
+    Output paths, including duplicate-name suffixes (_1, _2, ...), are
+    resolved serially in input order before any file is written, so every
+    worker writes a distinct file and the names match a serial loop.
+
+    Args:
+        conversation_irs: ConversationIR objects to write
+        output_dir: Directory to save JSON files
+        indent: JSON indentation level (None for compact output)
+        max_workers: Maximum writer threads
+
+    Returns:
+        Written file paths, in the same order as conversation_irs
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from chatweave.io.ir_writer import resolve_conversation_ir_paths, write_conversation_ir
+
+    output_paths = resolve_conversation_ir_paths(conversation_irs, output_dir)
+
+    def write(conversation_ir: "ConversationIR", output_path: Path) -> Path:
+        return write_conversation_ir(
+            conversation_ir, output_dir, indent=indent, output_path=output_path
+        )
+
+    workers = max(1, min(max_workers, len(conversation_irs)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(write, conversation_irs, output_paths))
+
+
+def _positive_int(value: str) -> int:
+    """Parse a positive integer command-line argument.
+
+    Args:
+        value: Raw argument string
+
+    Returns:
+        Parsed integer (at least 1)
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not an integer >= 1
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _preview(text: str, limit: int = 60) -> str:
+    """Truncate text for display, appending "..." when it is cut.
+
+    Args:
+        text: Text to preview
+        limit: Maximum number of characters to keep
+
+    Returns:
+        Preview string
+    """
+    return text[:limit] + "..." if len(text) > limit else text
+
+
 def build_ir_command(args):
     """Build IR from input files or directories."""
+    from chatweave.io.ir_writer import write_qa_unit_ir, write_session_ir
+    from chatweave.pipeline.build_session_ir import build_session_ir
+    from chatweave.util.logging_config import setup_logging
+    from chatweave.util.progress import ProgressTracker
+
     # Setup logging
     logger = setup_logging(
         verbose=args.verbose,
@@ -72,6 +218,9 @@ def build_ir_command(args):
         log_file=args.log_file,
     )
 
+    # Compact JSON unless pretty-printing is requested
+    indent = 2 if args.pretty else None
+
     # Resolve paths
     output_dir = args.output.resolve()
     working_dir = args.working_dir.resolve() if args.working_dir else output_dir
@@ -86,7 +235,9 @@ def build_ir_command(args):
             logger.debug(f"  - {f.name}")
 
     # Initialize progress tracker
-    progress = ProgressTracker(output_dir=working_dir, enabled=not args.dry_run)
+    progress = ProgressTracker(
+        output_dir=working_dir, enabled=not args.dry_run, buffered=True
+    )
     input_type = "directory" if len(args.input) == 1 and args.input[0].is_dir() else "files"
     progress.set_input(
         input_type=input_type,
@@ -99,25 +250,23 @@ def build_ir_command(args):
         logger.info("Step 1: Parsing JSONL files...")
         progress.start_step("parse", details={"files": len(jsonl_files)})
 
-        parser = UnifiedParser()
+        # Validate platform override (only for single file input)
+        platform_override = None
+        if args.platform:
+            if len(jsonl_files) > 1:
+                logger.warning(
+                    "--platform option is ignored when processing multiple files"
+                )
+            else:
+                platform_override = args.platform
+
         qa_units = {}
         conversation_irs = []
 
-        for jsonl_path in jsonl_files:
-            logger.info(f"Parsing {jsonl_path.name}...")
-
-            # Validate platform override (only for single file input)
-            platform_override = None
-            if args.platform:
-                if len(jsonl_files) > 1:
-                    logger.warning(
-                        "--platform option is ignored when processing multiple files"
-                    )
-                else:
-                    platform_override = args.platform
-
-            conversation_ir = parser.parse(jsonl_path, platform_override)
-            qa_ir = build_qa_ir(conversation_ir)
+        for jsonl_path, (conversation_ir, qa_ir) in zip(
+            jsonl_files, _parse_files(jsonl_files, platform_override, args.jobs)
+        ):
+            logger.info(f"Parsed {jsonl_path.name}")
 
             # Store ConversationIR in list (to handle multiple files from same platform)
             conversation_irs.append(conversation_ir)
@@ -140,11 +289,11 @@ def build_ir_command(args):
             progress.start_step("write_output")
 
             conversation_output_dir = output_dir / "conversation-ir"
-            written_files = []
+            written_files = _write_conversation_irs(
+                conversation_irs, conversation_output_dir, indent
+            )
 
-            for conversation_ir in conversation_irs:
-                output_path = write_conversation_ir(conversation_ir, conversation_output_dir)
-                written_files.append(output_path)
+            for output_path in written_files:
                 logger.info(f"  {output_path.name}")
 
             progress.complete_step("write_output", details={"files": len(written_files)})
@@ -169,7 +318,7 @@ def build_ir_command(args):
             written_files = []
 
             for platform, qa_ir in qa_units.items():
-                output_path = write_qa_unit_ir(qa_ir, qa_output_dir)
+                output_path = write_qa_unit_ir(qa_ir, qa_output_dir, indent=indent)
                 written_files.append(output_path)
                 logger.info(f"  {output_path.name}")
 
@@ -207,17 +356,15 @@ def build_ir_command(args):
             logger.info(f"Platforms: {', '.join(session_ir.platforms)}")
             logger.info(f"Total prompt groups: {len(session_ir.prompts)}")
 
+            # Build the per-prompt listing and log it as a single record
+            lines = []
             for i, prompt in enumerate(session_ir.prompts):
-                canonical_text = prompt.canonical_prompt["text"]
-                preview = (
-                    canonical_text[:60] + "..."
-                    if len(canonical_text) > 60
-                    else canonical_text
-                )
-                logger.info(f"\n  Prompt {i} ({prompt.prompt_key}):")
-                logger.info(f"    Text: {preview}")
-                logger.info(f"    Depends on: {prompt.depends_on or 'None'}")
-                logger.info(f"    Platforms: {len(prompt.per_platform)}")
+                lines.append(f"\n  Prompt {i} ({prompt.prompt_key}):")
+                lines.append(f"    Text: {_preview(prompt.canonical_prompt['text'])}")
+                lines.append(f"    Depends on: {prompt.depends_on or 'None'}")
+                lines.append(f"    Platforms: {len(prompt.per_platform)}")
+            if lines:
+                logger.info("\n".join(lines))
 
             output_path = output_dir / "session-ir" / f"{session_id}.json"
             logger.info(f"\nWould write to: {output_path}")
@@ -228,7 +375,7 @@ def build_ir_command(args):
         progress.start_step("write_output")
 
         session_output_dir = output_dir / "session-ir"
-        output_path = write_session_ir(session_ir, session_output_dir)
+        output_path = write_session_ir(session_ir, session_output_dir, indent=indent)
         logger.info(f"SessionIR written to: {output_path}")
 
         progress.complete_step("write_output")
@@ -236,23 +383,19 @@ def build_ir_command(args):
 
         # Display summary
         if args.verbose:
-            logger.info("\n=== Summary ===")
+            # Build the summary and log it as a single record
+            lines = ["\n=== Summary ==="]
             for i, prompt in enumerate(session_ir.prompts):
-                canonical_text = prompt.canonical_prompt["text"]
-                preview = (
-                    canonical_text[:60] + "..."
-                    if len(canonical_text) > 60
-                    else canonical_text
-                )
-                logger.info(f"\nPrompt {i} ({prompt.prompt_key}):")
-                logger.info(f"  Canonical: {preview}")
-                logger.info(f"  Depends on: {prompt.depends_on}")
-                logger.info(f"  Platforms: {len(prompt.per_platform)}")
+                lines.append(f"\nPrompt {i} ({prompt.prompt_key}):")
+                lines.append(f"  Canonical: {_preview(prompt.canonical_prompt['text'])}")
+                lines.append(f"  Depends on: {prompt.depends_on}")
+                lines.append(f"  Platforms: {len(prompt.per_platform)}")
                 for ref in prompt.per_platform:
-                    logger.info(
+                    lines.append(
                         f"    - {ref.platform}: {ref.qa_id} "
                         f"(similarity: {ref.prompt_similarity})"
                     )
+            logger.info("\n".join(lines))
 
     except Exception as e:
         logger.error(f"Error: {e}")
@@ -308,12 +451,24 @@ def main():
         default="session",
         help="Processing step to execute (default: session)",
     )
+    build_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=_positive_int,
+        default=None,
+        help="Number of worker processes for parsing (default: CPU count)",
+    )
     build_parser.add_argument(
         "--log-file",
         type=Path,
         default=None,
         help="Path to log file (default: no file logging)",
     )
+    build_parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Write indented (human-readable) JSON instead of compact JSON",
+    )
     build_parser.add_argument(
         "--dry-run", action="store_true", help="Preview without writing files"
     )
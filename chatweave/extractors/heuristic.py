@@ -15,20 +15,30 @@ class HeuristicQueryExtractor(QueryExtractor):
     - Claude: No standard pattern (returns None)
     """
 
-    # Start patterns (compiled regex)
+    # Start patterns in priority order: the first pattern with a match anywhere
+    # in the text wins, even over an earlier heading of a lower priority.
+    # Each consumes the rest of the heading line so match.end() is the body start.
     START_PATTERNS: List[re.Pattern] = [
-        re.compile(r'^##\s*1\\?\.\s*질문\s*정리', re.MULTILINE),  # 1. or 1\.
-        re.compile(r'^##\s+🧐\s*질문\s*정리', re.MULTILINE),
-        re.compile(r'^##\s+⚙️\s*질문\s*정리', re.MULTILINE),
-        re.compile(r'^##\s*질문\s*정리', re.MULTILINE),
+        re.compile(r'^##\s*1\\?\.\s*질문\s*정리[^\n]*\n?', re.MULTILINE),  # 1. or 1\.
+        re.compile(r'^##\s+🧐\s*질문\s*정리[^\n]*\n?', re.MULTILINE),
+        re.compile(r'^##\s+⚙️\s*질문\s*정리[^\n]*\n?', re.MULTILINE),
+        re.compile(r'^##\s*질문\s*정리[^\n]*\n?', re.MULTILINE),
     ]
 
-    # End patterns (priority order)
-    END_PATTERNS: List[re.Pattern] = [
-        re.compile(r'^##\s+', re.MULTILINE),  # Next ## heading
-        re.compile(r'^\*\s*\*\s*\*\s*$', re.MULTILINE),  # * * *
-        re.compile(r'^---+\s*$', re.MULTILINE),  # ---
-    ]
+    # End pattern: earliest of next ## heading, "* * *", or "---"
+    END_PATTERN: re.Pattern = re.compile(
+        r'^(?:##\s+|\*\s*\*\s*\*\s*$|---+\s*$)',
+        re.MULTILINE,
+    )
+
+    # Markdown escapes to unescape (\*, \-, \[, \])
+    ESCAPE_PATTERN: re.Pattern = re.compile(r'\\([*\-\[\]])')
+
+    # Whitespace surrounding a line break (excluding the newline itself)
+    LINE_EDGE_WHITESPACE_PATTERN: re.Pattern = re.compile(r'[^\S\n]*\n[^\S\n]*')
+
+    # Runs of blank lines (3+ newlines)
+    MULTI_NEWLINE_PATTERN: re.Pattern = re.compile(r'\n{3,}')
 
     def extract(self, assistant_content: str) -> Optional[str]:
         """Extract question summary from assistant response.
@@ -42,17 +52,20 @@ class HeuristicQueryExtractor(QueryExtractor):
         if not assistant_content:
             return None
 
+        # Every start heading contains both markers; skip the regex otherwise
+        if '##' not in assistant_content or '질문' not in assistant_content:
+            return None
+
         # Find start position
         start_match, start_end = self._find_section_start(assistant_content)
         if start_match is None:
             return None
 
-        # Find end position (after the start)
-        remaining_content = assistant_content[start_end:]
-        end_pos = self._find_section_end(remaining_content)
+        # Find end position (after the start), scanning in place
+        end_pos = self._find_section_end(assistant_content, start_end)
 
         # Extract section content
-        section_content = remaining_content[:end_pos].strip()
+        section_content = assistant_content[start_end:end_pos].strip()
 
         # Clean up the extracted content
         return self._clean_content(section_content) or None
@@ -66,27 +79,22 @@ class HeuristicQueryExtractor(QueryExtractor):
         for pattern in self.START_PATTERNS:
             match = pattern.search(content)
             if match:
-                # Return position after the heading line
-                line_end = content.find('\n', match.end())
-                if line_end == -1:
-                    line_end = len(content)
-                return match, line_end + 1
+                # Match already extends past the heading line
+                return match, match.end()
         return None, 0
 
-    def _find_section_end(self, content: str) -> int:
+    def _find_section_end(self, content: str, pos: int = 0) -> int:
         """Find the end of the question summary section.
 
+        Args:
+            content: Full assistant content
+            pos: Position to start searching from (start of a line)
+
         Returns:
             Position of the section end
         """
-        earliest_end = len(content)
-
-        for pattern in self.END_PATTERNS:
-            match = pattern.search(content)
-            if match and match.start() < earliest_end:
-                earliest_end = match.start()
-
-        return earliest_end
+        match = self.END_PATTERN.search(content, pos)
+        return match.start() if match else len(content)
 
     def _clean_content(self, content: str) -> str:
         """Clean up extracted content.
@@ -99,18 +107,13 @@ class HeuristicQueryExtractor(QueryExtractor):
             return ""
 
         # Remove common markdown escapes
-        content = content.replace('\\*', '*')
-        content = content.replace('\\-', '-')
-        content = content.replace('\\[', '[')
-        content = content.replace('\\]', ']')
+        content = self.ESCAPE_PATTERN.sub(r'\1', content)
 
-        # Normalize whitespace (preserve paragraph breaks)
-        lines = content.split('\n')
-        lines = [line.strip() for line in lines]
-        content = '\n'.join(lines)
+        # Normalize whitespace (preserve paragraph breaks): strip every line
+        # in one pass; the first/last line are handled by the final strip()
+        content = self.LINE_EDGE_WHITESPACE_PATTERN.sub('\n', content)
 
         # Remove multiple blank lines
-        while '\n\n\n' in content:
-            content = content.replace('\n\n\n', '\n\n')
+        content = self.MULTI_NEWLINE_PATTERN.sub('\n\n', content)
 
         return content.strip()
@@ -1,6 +1,6 @@
 """I/O utilities for reading and writing files."""
 
 from chatweave.io.ir_writer import write_conversation_ir, write_qa_unit_ir
-from chatweave.io.jsonl_loader import load_jsonl
+from chatweave.io.jsonl_loader import load_jsonl, load_jsonl_batch
 
-__all__ = ["load_jsonl", "write_conversation_ir", "write_qa_unit_ir"]
+__all__ = ["load_jsonl", "load_jsonl_batch", "write_conversation_ir", "write_qa_unit_ir"]
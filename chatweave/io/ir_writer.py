@@ -1,20 +1,41 @@
 """IR writer for saving ConversationIR and QAUnitIR to JSON files."""
 
 import json
+import os
+import threading
+from contextlib import contextmanager, suppress
 from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
 
 from chatweave.models.conversation import ConversationIR
 from chatweave.models.qa_unit import QAUnitIR
 from chatweave.models.session import MultiModelSessionIR
 
+# Write buffer size: streamed writers emit many small chunks (one per list
+# item), so a large buffer coalesces them into few write() syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
 
-def _get_unique_path(output_dir: Path, base_name: str, extension: str = ".json") -> Path:
+def _get_unique_path(
+    output_dir: Path,
+    base_name: str,
+    extension: str = ".json",
+    taken: Optional[Set[str]] = None,
+) -> Path:
     """Get unique file path, adding numeric suffix if file exists.
 
     Args:
         output_dir: Directory for output file
         base_name: Base filename without extension
         extension: File extension (default: .json)
+        taken: Optional set of file names already in use (existing or
+            reserved). When given, it is consulted instead of the
+            filesystem and the returned name is added to it.
 
     Returns:
         Unique Path that doesn't exist yet
@@ -25,22 +46,193 @@ def _get_unique_path(output_dir: Path, base_name: str, extension: str = ".json")
         If chatgpt_conv_abc123_1.json also exists:
         - Returns chatgpt_conv_abc123_2.json
     """
-    output_path = output_dir / f"{base_name}{extension}"
+    name = f"{base_name}{extension}"
+
+    if taken is None:
+        if not (output_dir / name).exists():
+            return output_dir / name
+        # File exists, list the directory once and probe suffixes in memory
+        with os.scandir(output_dir) as entries:
+            existing = {entry.name for entry in entries}
+    else:
+        existing = taken
+
+    counter = 0
+    while name in existing:
+        counter += 1
+        name = f"{base_name}_{counter}{extension}"
+    if taken is not None:
+        taken.add(name)
+    return output_dir / name
 
-    if not output_path.exists():
-        return output_path
 
-    # File exists, find unique suffix
-    counter = 1
-    while True:
-        output_path = output_dir / f"{base_name}_{counter}{extension}"
-        if not output_path.exists():
-            return output_path
-        counter += 1
+def _conversation_base_name(conversation_ir: ConversationIR) -> str:
+    """Build the output base name for a ConversationIR."""
+    return f"{conversation_ir.platform}_conv_{conversation_ir.conversation_id}"
+
+
+def resolve_conversation_ir_paths(
+    conversation_irs: List[ConversationIR], output_dir: Path
+) -> List[Path]:
+    """Resolve unique output paths for a batch of ConversationIR files.
+
+    Paths are assigned in input order against the directory contents and
+    the paths reserved earlier in the batch, so duplicate-name suffixes
+    (_1, _2, ...) are exactly those a serial write_conversation_ir loop
+    would produce. Once resolved, the files can be written in any order.
+
+    Args:
+        conversation_irs: ConversationIR objects to be written
+        output_dir: Directory the files will be written to
+
+    Returns:
+        Output paths, in the same order as conversation_irs
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with os.scandir(output_dir) as entries:
+        taken = {entry.name for entry in entries}
+    return [
+        _get_unique_path(output_dir, _conversation_base_name(ir), taken=taken)
+        for ir in conversation_irs
+    ]
+
+
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    """Stdlib json fallback hook that serializes IR models via to_dict()."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    """Serialize data to UTF-8 encoded JSON bytes.
+
+    Uses orjson when it is installed and the requested layout is one it
+    supports (compact or 2-space indent); otherwise falls back to the
+    stdlib encoder.
+
+    IR model dataclasses may be passed directly: orjson encodes them
+    natively in field order (datetimes as ISO 8601), and the stdlib path
+    calls their to_dict(). This only yields identical output for models
+    whose to_dict() mirrors the dataclass fields (MessageIR, QAUnit,
+    PromptGroup); ArtifactIR must still be converted explicitly.
+
+    Args:
+        data: JSON-serializable value or IR model dataclass
+        indent: JSON indentation level (None for compact output)
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent is not None:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent is None:
+        return json.dumps(
+            data, separators=(",", ":"), ensure_ascii=False, default=_to_dict
+        ).encode("utf-8")
+    return json.dumps(
+        data, indent=indent, ensure_ascii=False, default=_to_dict
+    ).encode("utf-8")
+
+
+@contextmanager
+def _atomic_open(output_path: Path) -> Iterator[BinaryIO]:
+    """Open a temporary file that atomically replaces output_path on success.
+
+    The temporary file is created in the same directory so that os.replace()
+    is a rename on the same filesystem. If writing fails, the temporary file
+    is removed and output_path is left untouched.
+
+    Args:
+        output_path: Final destination file path
+
+    Yields:
+        Binary file object for the temporary file
+    """
+    # Unique per process/thread; created with default permissions (umask)
+    tmp_name = output_path.parent / (
+        f".{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    fd = os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _write_streamed_json(
+    output_path: Path,
+    head: List[Tuple[str, Any]],
+    list_key: str,
+    items: Iterable[Any],
+    tail: List[Tuple[str, Any]],
+    indent: Optional[int] = None,
+) -> None:
+    """Stream a JSON object whose bulk is one list, encoding one item at a time.
+
+    Writes {head..., list_key: [items...], tail...} with the same bytes as
+    serializing the equivalent dictionary in one call, but only one list item
+    is materialized at a time, so the full IR dict tree is never built.
+
+    Args:
+        output_path: Destination file path
+        head: (key, value) pairs written before the list
+        list_key: Key of the streamed list
+        items: Iterable of list items (JSON values or IR model dataclasses)
+        tail: (key, value) pairs written after the list
+        indent: JSON indentation level (None for compact output)
+    """
+    if indent is None:
+        level1 = level2 = closing = b""
+        key_separator = b":"
+    else:
+        level1 = b"\n" + b" " * indent
+        level2 = level1 + b" " * indent
+        closing = b"\n"
+        key_separator = b": "
+
+    def nested(value: Any, prefix: bytes) -> bytes:
+        # Encoded values never contain raw newlines (they are escaped inside
+        # strings), so nesting is applied by re-indenting after each newline.
+        encoded = _dumps(value, indent)
+        return encoded.replace(b"\n", prefix) if prefix else encoded
+
+    def field(key: str, value: Any) -> bytes:
+        return level1 + _dumps(key) + key_separator + nested(value, level1)
+
+    with _atomic_open(output_path) as f:
+        f.write(b"{")
+        for key, value in head:
+            f.write(field(key, value) + b",")
+
+        f.write(level1 + _dumps(list_key) + key_separator + b"[")
+        empty = True
+        for item in items:
+            if not empty:
+                f.write(b",")
+            f.write(level2 + nested(item, level2))
+            empty = False
+        if not empty:
+            f.write(level1)
+        f.write(b"]")
+
+        for key, value in tail:
+            f.write(b"," + field(key, value))
+        f.write(closing + b"}")
 
 
 def write_conversation_ir(
-    conversation_ir: ConversationIR, output_dir: Path, indent: int = 2
+    conversation_ir: ConversationIR,
+    output_dir: Path,
+    indent: Optional[int] = None,
+    output_path: Optional[Path] = None,
 ) -> Path:
     """Write ConversationIR to JSON file.
 
@@ -50,7 +242,9 @@ def write_conversation_ir(
     Args:
         conversation_ir: ConversationIR object to save
         output_dir: Directory to save JSON file
-        indent: JSON indentation level (default: 2)
+        indent: JSON indentation level (default: None, compact output)
+        output_path: Pre-resolved destination (see
+            resolve_conversation_ir_paths); skips unique-name resolution
 
     Returns:
         Path to written JSON file
@@ -62,21 +256,35 @@ def write_conversation_ir(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate unique filename (adds _1, _2, etc. if file exists)
-    base_name = f"{conversation_ir.platform}_conv_{conversation_ir.conversation_id}"
-    output_path = _get_unique_path(output_dir, base_name)
-
-    # Convert to dictionary
-    ir_dict = conversation_ir.to_dict()
-
-    # Write to file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(ir_dict, f, indent=indent, ensure_ascii=False)
+    if output_path is None:
+        output_path = _get_unique_path(
+            output_dir, _conversation_base_name(conversation_ir)
+        )
+
+    # Stream messages to file without building the full dictionary
+    # (field order mirrors ConversationIR.to_dict)
+    tail = []
+    if conversation_ir.artifacts:
+        tail.append(("artifacts", [a.to_dict() for a in conversation_ir.artifacts]))
+    _write_streamed_json(
+        output_path,
+        head=[
+            ("schema", conversation_ir.schema),
+            ("platform", conversation_ir.platform),
+            ("conversation_id", conversation_ir.conversation_id),
+            ("meta", conversation_ir.meta),
+        ],
+        list_key="messages",
+        items=conversation_ir.messages,
+        tail=tail,
+        indent=indent,
+    )
 
     return output_path
 
 
 def write_qa_unit_ir(
-    qa_unit_ir: QAUnitIR, output_dir: Path, indent: int = 2
+    qa_unit_ir: QAUnitIR, output_dir: Path, indent: Optional[int] = None
 ) -> Path:
     """Write QAUnitIR to JSON file.
 
@@ -86,7 +294,7 @@ def write_qa_unit_ir(
     Args:
         qa_unit_ir: QAUnitIR object to save
         output_dir: Directory to save JSON file
-        indent: JSON indentation level (default: 2)
+        indent: JSON indentation level (default: None, compact output)
 
     Returns:
         Path to written JSON file
@@ -101,18 +309,26 @@ def write_qa_unit_ir(
     base_name = f"{qa_unit_ir.platform}_qau_{qa_unit_ir.conversation_id}"
     output_path = _get_unique_path(output_dir, base_name)
 
-    # Convert to dictionary
-    ir_dict = qa_unit_ir.to_dict()
-
-    # Write to file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(ir_dict, f, indent=indent, ensure_ascii=False)
+    # Stream QA units to file without building the full dictionary
+    # (field order mirrors QAUnitIR.to_dict)
+    _write_streamed_json(
+        output_path,
+        head=[
+            ("schema", qa_unit_ir.schema),
+            ("platform", qa_unit_ir.platform),
+            ("conversation_id", qa_unit_ir.conversation_id),
+        ],
+        list_key="qa_units",
+        items=qa_unit_ir.qa_units,
+        tail=[],
+        indent=indent,
+    )
 
     return output_path
 
 
 def write_session_ir(
-    session_ir: MultiModelSessionIR, output_dir: Path, indent: int = 2
+    session_ir: MultiModelSessionIR, output_dir: Path, indent: Optional[int] = None
 ) -> Path:
     """Write MultiModelSessionIR to JSON file.
 
@@ -121,7 +337,7 @@ def write_session_ir(
     Args:
         session_ir: MultiModelSessionIR object to save
         output_dir: Directory to save JSON file
-        indent: JSON indentation level (default: 2)
+        indent: JSON indentation level (default: None, compact output)
 
     Returns:
         Path to written JSON file
@@ -136,11 +352,20 @@ def write_session_ir(
     base_name = f"mms_{session_ir.session_id}"
     output_path = _get_unique_path(output_dir, base_name)
 
-    # Convert to dictionary
-    ir_dict = session_ir.to_dict()
-
-    # Write to file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(ir_dict, f, indent=indent, ensure_ascii=False)
+    # Stream prompt groups to file without building the full dictionary
+    # (field order mirrors MultiModelSessionIR.to_dict)
+    _write_streamed_json(
+        output_path,
+        head=[
+            ("schema", session_ir.schema),
+            ("session_id", session_ir.session_id),
+            ("platforms", session_ir.platforms),
+            ("conversations", session_ir.conversations),
+        ],
+        list_key="prompts",
+        items=session_ir.prompts,
+        tail=[("meta", session_ir.meta)],
+        indent=indent,
+    )
 
     return output_path
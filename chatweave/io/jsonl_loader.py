@@ -1,9 +1,21 @@
 """JSONL file loading utilities."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+# Lines are parsed straight from bytes, skipping a UTF-8 decode per line
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Large exports are read in 64 KiB chunks rather than the 8 KiB default
+READ_BUFFER_SIZE = 1 << 16
+
 
 def load_jsonl(
     file_path: Path,
@@ -33,14 +45,13 @@ def load_jsonl(
     messages = []
     artifacts = []
 
-    with open(file_path, "r", encoding="utf-8") as f:
+    with open(file_path, "rb", buffering=READ_BUFFER_SIZE) as f:
         for line_num, line in enumerate(f, start=1):
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
 
             try:
-                data = json.loads(line)
+                data = _loads(line)
             except json.JSONDecodeError as e:
                 raise json.JSONDecodeError(
                     f"Invalid JSON at line {line_num}: {e.msg}", e.doc, e.pos
@@ -52,15 +63,12 @@ def load_jsonl(
                     raise ValueError(
                         f"First line must be metadata with '_meta': true, got: {data}"
                     )
-                metadata = {
-                    k: v for k, v in data.items() if k != "_meta"
-                }  # Remove _meta flag
+                del data["_meta"]  # Remove _meta flag
+                metadata = data
             elif data.get("_artifact"):
                 # Artifact line: strip _artifact flag and collect
-                artifact_data = {
-                    k: v for k, v in data.items() if k != "_artifact"
-                }
-                artifacts.append(artifact_data)
+                del data["_artifact"]
+                artifacts.append(data)
             else:
                 # Validate message structure
                 if "role" not in data or "content" not in data:
@@ -73,3 +81,32 @@ def load_jsonl(
         raise ValueError("No metadata found in JSONL file")
 
     return metadata, messages, artifacts
+
+
+def load_jsonl_batch(
+    file_paths: List[Path], max_workers: int = 8
+) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]]:
+    """Load several JSONL files concurrently with a thread pool.
+
+    Threads overlap the file reads, which release the GIL; JSON parsing
+    itself still holds the GIL, so CPU-bound speedups come from the
+    process pool used by the CLI rather than from this helper.
+
+    Args:
+        file_paths: Paths to JSONL files
+        max_workers: Maximum number of loader threads (default: 8)
+
+    Returns:
+        One load_jsonl() result per path, in input order
+
+    Raises:
+        ValueError: If any file format is invalid or metadata line is missing
+        FileNotFoundError: If any file does not exist
+        json.JSONDecodeError: If JSON parsing fails for any file
+    """
+    workers = min(max_workers, len(file_paths))
+    if workers <= 1:
+        return [load_jsonl(path) for path in file_paths]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(load_jsonl, file_paths))
@@ -1,6 +1,7 @@
 """Hash-based query matcher."""
 
-from typing import Dict, List
+from collections import defaultdict
+from typing import DefaultDict, List
 
 from chatweave.matchers.base import QueryMatcher
 from chatweave.models.qa_unit import QAUnit
@@ -25,28 +26,19 @@ class HashQueryMatcher(QueryMatcher):
             Units with same hash are grouped together.
             Units without hash (None) become singleton groups at the end.
         """
-        hash_groups: Dict[str, List[QAUnit]] = {}
+        hash_groups: DefaultDict[str, List[QAUnit]] = defaultdict(list)
         no_hash_units: List[QAUnit] = []
-        hash_order: List[str] = []
 
         for unit in units:
-            if unit.user_query_hash is None:
+            hash_val = unit.user_query_hash
+            if hash_val is None:
                 no_hash_units.append(unit)
             else:
-                hash_val = unit.user_query_hash
-                if hash_val not in hash_groups:
-                    hash_groups[hash_val] = []
-                    hash_order.append(hash_val)
                 hash_groups[hash_val].append(unit)
 
-        # Build result: hash groups first (in order of first occurrence),
+        # Build result: hash groups first (dicts keep first-occurrence order),
         # then no-hash units as singletons
-        result: List[List[QAUnit]] = []
-
-        for hash_val in hash_order:
-            result.append(hash_groups[hash_val])
-
-        for unit in no_hash_units:
-            result.append([unit])
+        result: List[List[QAUnit]] = list(hash_groups.values())
+        result.extend([unit] for unit in no_hash_units)
 
         return result
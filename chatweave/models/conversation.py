@@ -8,7 +8,7 @@ Role = Literal["user", "assistant"]
 Platform = Literal["chatgpt", "claude", "gemini", "grok", "perplexity"]
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageIR:
     """Individual message unit in a conversation.
 
@@ -49,7 +49,7 @@ class MessageIR:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtifactIR:
     """Artifact attached to a conversation (e.g., Claude artifact export).
 
@@ -80,7 +80,7 @@ class ArtifactIR:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationIR:
     """Platform-specific conversation representation.
 
@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional
 from chatweave.models.conversation import Platform
 
 
-@dataclass
+@dataclass(slots=True)
 class QAUnit:
     """A single question-answer pair extracted from a conversation.
 
@@ -47,7 +47,7 @@ class QAUnit:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class QAUnitIR:
     """Collection of QA units from a single conversation.
 
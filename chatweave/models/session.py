@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional
 from chatweave.models.conversation import Platform
 
 
-@dataclass
+@dataclass(slots=True)
 class PerPlatformQARef:
     """Reference to a QA unit from a specific platform.
 
@@ -41,7 +41,7 @@ class PerPlatformQARef:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptGroup:
     """A group of QA units answering the same question across platforms.
 
@@ -70,7 +70,7 @@ class PromptGroup:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiModelSessionIR:
     """Cross-platform session alignment.
 
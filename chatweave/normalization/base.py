@@ -1,7 +1,7 @@
 """Base classes for normalization passes."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import ClassVar, Optional
 
 from chatweave.normalization.context import NormalizationContext
 
@@ -23,8 +23,15 @@ class NormalizationPass(ABC):
 
     Each pass represents a single transformation step in the normalization pipeline.
     Passes are executed in sequence, with each pass repeating until convergence.
+
+    Attributes:
+        idempotent: True if action(action(t)) == action(t) for every input.
+            PassRunner then applies the pass once instead of running an
+            extra iteration just to confirm convergence.
     """
 
+    idempotent: ClassVar[bool] = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -85,13 +92,18 @@ class PassRunner:
         """Initialize PassRunner.
 
         Args:
-            passes: List of passes to execute in order.
+            passes: List of passes to execute in order. Their methods are
+                bound once here, so the list should not be modified later.
             strict: If True, raise PostConditionError on post_condition failure.
             max_iterations: Safety limit for convergence loop per pass.
         """
         self.passes = passes
         self.strict = strict
         self.max_iterations = max_iterations
+        # (pass, pre_condition, action, idempotent) bound once per runner
+        self._bound = [
+            (p, p.pre_condition, p.action, p.idempotent) for p in passes
+        ]
 
     def run(
         self, text: str, ctx: Optional[NormalizationContext] = None
@@ -112,20 +124,27 @@ class PassRunner:
         if ctx is None:
             ctx = NormalizationContext()
 
-        for pass_ in self.passes:
+        max_iterations = self.max_iterations
+        strict = self.strict
+
+        for pass_, pre_condition, action, idempotent in self._bound:
             # Check pre_condition
-            if not pass_.pre_condition(text, ctx):
+            if not pre_condition(text, ctx):
                 continue
 
-            # Run until convergence (or max_iterations)
-            for _ in range(self.max_iterations):
-                new_text = pass_.action(text, ctx)
-                if new_text == text:
-                    break
-                text = new_text
+            # Run until convergence (or max_iterations); a single
+            # application already converges for idempotent passes
+            if idempotent:
+                text = action(text, ctx)
+            else:
+                for _ in range(max_iterations):
+                    new_text = action(text, ctx)
+                    if new_text == text:
+                        break
+                    text = new_text
 
             # Check post_condition in strict mode
-            if self.strict and not pass_.post_condition(text, ctx):
+            if strict and not pass_.post_condition(text, ctx):
                 raise PostConditionError(
                     pass_name=pass_.name,
                     message="Post-condition check failed",
@@ -2,11 +2,24 @@
 
 import re
 import unicodedata
+from functools import lru_cache
 
 from chatweave.normalization.base import NormalizationPass
 from chatweave.normalization.context import NormalizationContext
 
 
+def _leading_spaces(line: str) -> int:
+    """Count the spaces at the start of a line."""
+    return len(line) - len(line.lstrip(" "))
+
+
+@lru_cache(maxsize=None)
+def _placeholder_pattern(placeholder_base: str) -> "re.Pattern[str]":
+    """Compile a pattern matching any placeholder built from placeholder_base."""
+    prefix, _, suffix = placeholder_base.partition("{}")
+    return re.compile(re.escape(prefix) + r"(0|[1-9][0-9]*)" + re.escape(suffix))
+
+
 class CodeBlockProtectionPass(NormalizationPass):
     """Extract code blocks and replace with placeholders.
 
@@ -14,6 +27,14 @@ class CodeBlockProtectionPass(NormalizationPass):
     being modified by subsequent passes.
     """
 
+    EXTRA_BACKTICKS_PATTERN = re.compile(r"^(`{4,})", re.MULTILINE)
+    # Fenced (```) or inline (`) code in one left-to-right scan. The fenced
+    # alternative is tried first, and inline code may not close on the
+    # opening backticks of a complete fence, so fences keep precedence.
+    CODE_PATTERN = re.compile(
+        r"```[^\n]*\n.*?```|`[^`\n]+`(?!``[^\n]*\n.*?```)", re.DOTALL
+    )
+
     @property
     def name(self) -> str:
         return "CodeBlockProtection"
@@ -23,42 +44,45 @@ class CodeBlockProtectionPass(NormalizationPass):
 
     def action(self, text: str, ctx: NormalizationContext) -> str:
         # Normalize extra backticks to exactly 3 (common LLM error)
-        text = re.sub(r"^(`{4,})", "```", text, flags=re.MULTILINE)
+        text = self.EXTRA_BACKTICKS_PATTERN.sub("```", text)
 
-        # Match fenced code blocks (```)
-        def replace_fenced(match):
-            ctx.code_blocks.append(match.group(0))
-            return ctx.placeholder_base.format(len(ctx.code_blocks) - 1)
+        # Split the placeholder once instead of re-parsing it via format()
+        prefix, _, suffix = ctx.placeholder_base.partition("{}")
+        code_blocks = ctx.code_blocks
 
-        text = re.sub(
-            r"```[^\n]*\n.*?```", replace_fenced, text, flags=re.DOTALL
-        )
-
-        # Match inline code (`)
-        def replace_inline(match):
-            ctx.code_blocks.append(match.group(0))
-            return ctx.placeholder_base.format(len(ctx.code_blocks) - 1)
+        # Match fenced (```) and inline (`) code
+        def replace_code(match):
+            index = len(code_blocks)
+            code_blocks.append(match.group(0))
+            return f"{prefix}{index}{suffix}"
 
-        text = re.sub(r"`[^`\n]+`", replace_inline, text)
+        text = self.CODE_PATTERN.sub(replace_code, text)
 
         return text
 
     def post_condition(self, text: str, ctx: NormalizationContext) -> bool:
         # No raw fenced code blocks should remain (only placeholders)
         # Simple check: no ``` patterns outside of placeholders
-        temp = text
-        for i in range(len(ctx.code_blocks)):
-            temp = temp.replace(ctx.placeholder_base.format(i), "")
+        if "`" not in text:
+            return True
+        temp = _placeholder_pattern(ctx.placeholder_base).sub("", text)
         return "```" not in temp
 
 
 class UnicodeNormalizationPass(NormalizationPass):
     """Normalize Unicode to NFC form."""
 
+    # NFC(NFC(text)) == NFC(text)
+    idempotent = True
+
     @property
     def name(self) -> str:
         return "UnicodeNormalization"
 
+    def pre_condition(self, text: str, ctx: NormalizationContext) -> bool:
+        # ASCII text is already in NFC form
+        return not text.isascii()
+
     def action(self, text: str, ctx: NormalizationContext) -> str:
         return unicodedata.normalize("NFC", text)
 
@@ -80,12 +104,41 @@ class ListStructurePass(NormalizationPass):
     - Indent dash block after numbered items
     """
 
+    # A digit directly before "." is enough to detect "\d+\."
+    NUMBERED_PATTERN = re.compile(r"\d\.")
+    BLOCKQUOTE_DASH_PATTERN = re.compile(r"^> - ", re.MULTILINE)
+    DUPLICATE_DASH_PATTERN = re.compile(r"^(\s*)- - ", re.MULTILINE)
+    EMPTY_ITEM_PATTERN = re.compile(r"\n *-[ \t]*(?=\n)")
+    SUB_ITEM_INDENT_PATTERN = re.compile(r"\n {1,3}(-|\d+\.|\x00)")
+    HEADING_PATTERN = re.compile(r"^#{1,6} ")
+    INDENTED_DASH_PATTERN = re.compile(r"^ {4,}- ")
+    # Both dedent helpers only act on a 4+ space "- " line after another line
+    INDENTED_DASH_LINE_PATTERN = re.compile(r"\n {4,}- ")
+    DASH_COLON_ITEM_PATTERN = re.compile(r"^- .+:$")
+    # A dash item ending with ":" directly followed by a numbered item
+    DASH_COLON_THEN_NUMBERED_PATTERN = re.compile(r"^- [^\n]+:\n\d+\. ", re.MULTILINE)
+    NUMBERED_ITEM_PATTERN = re.compile(r"^\d+\. ")
+    NUMBERED_THEN_DASH_PATTERN = re.compile(r"(?:^|\n)\d+\. [^\n]*\n\n*-")
+    DASH_PREFIX_PATTERN = re.compile(r"^(    )?(-)", re.MULTILINE)
+    LEADING_NEWLINES_PATTERN = re.compile(r"^\n+")
+    BLANK_BEFORE_DASH_PATTERN = re.compile(r"\n\n+(\s*-)")
+    # Requires space after \d+\. to match only real numbered items
+    # e.g., "1. item" matches but "5-1.item" does not
+    # The middle block is consumed a whole line at a time, up to the next
+    # numbered item or the end (a final newline is left unmatched)
+    NUMBERED_BLOCK_PATTERN = re.compile(
+        r"((?:^|\n)\d+\. [^\n]*\n)([^\n]*(?:\n(?!\d+\. |\Z)[^\n]*)*)(\n\d+\. |$)"
+    )
+
     @property
     def name(self) -> str:
         return "ListStructure"
 
     def pre_condition(self, text: str, ctx: NormalizationContext) -> bool:
-        return "-" in text or re.search(r"\d+\.", text) is not None
+        if "-" in text:
+            return True
+        # Numbered items need a ".", so skip the regex scan without one
+        return "." in text and self.NUMBERED_PATTERN.search(text) is not None
 
     def action(self, text: str, ctx: NormalizationContext) -> str:
         # Dedent list after heading
@@ -95,16 +148,16 @@ class ListStructurePass(NormalizationPass):
         text = self._dedent_list_after_colon_text(text)
 
         # Remove dash after blockquote marker
-        text = re.sub(r"^> - ", "> ", text, flags=re.MULTILINE)
+        text = self.BLOCKQUOTE_DASH_PATTERN.sub("> ", text)
 
         # Remove duplicate list markers
-        text = re.sub(r"^(\s*)- - ", r"\1- ", text, flags=re.MULTILINE)
+        text = self.DUPLICATE_DASH_PATTERN.sub(r"\1- ", text)
 
         # Remove empty list items
-        text = re.sub(r"\n *-[ \t]*(?=\n)", "", text)
+        text = self.EMPTY_ITEM_PATTERN.sub("", text)
 
         # Sub-item indentation normalization (1-3 spaces -> 4)
-        text = re.sub(r"\n {1,3}(-|\d+\.|\x00)", r"\n    \1", text)
+        text = self.SUB_ITEM_INDENT_PATTERN.sub(r"\n    \1", text)
 
         # Indent numbered list after dash with colon
         text = self._indent_numbered_after_dash_colon(text)
@@ -116,6 +169,9 @@ class ListStructurePass(NormalizationPass):
 
     def _dedent_list_after_heading(self, text: str) -> str:
         """Dedent indented list that follows a heading."""
+        if not self.INDENTED_DASH_LINE_PATTERN.search(text):
+            return text
+
         lines = text.split("\n")
         result = []
         i = 0
@@ -123,28 +179,20 @@ class ListStructurePass(NormalizationPass):
             line = lines[i]
             result.append(line)
             # Detect heading (# to ######)
-            if re.match(r"^#{1,6} ", line):
+            if self.HEADING_PATTERN.match(line):
                 j = i + 1
                 # Check if next line is indented list (4+ spaces + -)
-                if j < len(lines) and re.match(r"^ {4,}- ", lines[j]):
+                if j < len(lines) and self.INDENTED_DASH_PATTERN.match(lines[j]):
                     # Add blank line after heading
                     result.append("")
                     # Find base indent and dedent the block
-                    base_indent_match = re.match(r"^( +)", lines[j])
-                    base_indent = (
-                        len(base_indent_match.group(1)) if base_indent_match else 0
-                    )
+                    base_indent = _leading_spaces(lines[j])
                     while j < len(lines):
                         if not lines[j].strip():
                             result.append("")
                             j += 1
                             continue
-                        current_indent_match = re.match(r"^( *)", lines[j])
-                        current_indent = (
-                            len(current_indent_match.group(1))
-                            if current_indent_match
-                            else 0
-                        )
+                        current_indent = _leading_spaces(lines[j])
                         if current_indent >= base_indent and lines[j].strip():
                             result.append(lines[j][base_indent:])
                             j += 1
@@ -158,6 +206,9 @@ class ListStructurePass(NormalizationPass):
 
     def _dedent_list_after_colon_text(self, text: str) -> str:
         """Dedent indented list that follows text ending with colon."""
+        if not self.INDENTED_DASH_LINE_PATTERN.search(text):
+            return text
+
         lines = text.split("\n")
         result = []
         i = 0
@@ -172,22 +223,14 @@ class ListStructurePass(NormalizationPass):
             ):
                 j = i + 1
                 # Check if next line is indented list (4+ spaces + -)
-                if j < len(lines) and re.match(r"^ {4,}- ", lines[j]):
-                    base_indent_match = re.match(r"^( +)", lines[j])
-                    base_indent = (
-                        len(base_indent_match.group(1)) if base_indent_match else 0
-                    )
+                if j < len(lines) and self.INDENTED_DASH_PATTERN.match(lines[j]):
+                    base_indent = _leading_spaces(lines[j])
                     while j < len(lines):
                         if not lines[j].strip():
                             result.append("")
                             j += 1
                             continue
-                        current_indent_match = re.match(r"^( *)", lines[j])
-                        current_indent = (
-                            len(current_indent_match.group(1))
-                            if current_indent_match
-                            else 0
-                        )
+                        current_indent = _leading_spaces(lines[j])
                         if current_indent >= base_indent and lines[j].strip():
                             result.append(lines[j][base_indent:])
                             j += 1
@@ -201,6 +244,9 @@ class ListStructurePass(NormalizationPass):
 
     def _indent_numbered_after_dash_colon(self, text: str) -> str:
         """Indent numbered list that follows dash item ending with colon."""
+        if not self.DASH_COLON_THEN_NUMBERED_PATTERN.search(text):
+            return text
+
         lines = text.split("\n")
         result = []
         i = 0
@@ -208,10 +254,10 @@ class ListStructurePass(NormalizationPass):
             line = lines[i]
             result.append(line)
             # Detect dash item ending with colon
-            if re.match(r"^- .+:$", line):
+            if self.DASH_COLON_ITEM_PATTERN.match(line):
                 j = i + 1
                 # Check if next line is numbered list at root level
-                while j < len(lines) and re.match(r"^\d+\. ", lines[j]):
+                while j < len(lines) and self.NUMBERED_ITEM_PATTERN.match(lines[j]):
                     result.append("    " + lines[j])
                     j += 1
                 if j > i + 1:
@@ -225,7 +271,7 @@ class ListStructurePass(NormalizationPass):
         # If no root-level dash after numbered item, already processed (idempotent)
         # Pattern requires line start (^|\n) and space after number to avoid
         # matching "5-1." as numbered item (the "1." part would incorrectly match)
-        if not re.search(r"(?:^|\n)\d+\. [^\n]*\n\n*-", text):
+        if not self.NUMBERED_THEN_DASH_PATTERN.search(text):
             return text
 
         def process_match(match: re.Match) -> str:
@@ -243,21 +289,16 @@ class ListStructurePass(NormalizationPass):
                 else:
                     return "    -"
 
-            indented = re.sub(
-                r"^(    )?(-)", indent_dashes, middle_block, flags=re.MULTILINE
-            )
-            indented = re.sub(r"^\n+", "", indented)
-            indented = re.sub(r"\n\n+(\s*-)", r"\n\1", indented)
+            indented = self.DASH_PREFIX_PATTERN.sub(indent_dashes, middle_block)
+            indented = self.LEADING_NEWLINES_PATTERN.sub("", indented)
+            indented = self.BLANK_BEFORE_DASH_PATTERN.sub(r"\n\1", indented)
             return numbered_line + indented + next_part
 
-        # Pattern requires space after \d+\. to match only real numbered items
-        # e.g., "1. item" matches but "5-1.item" does not
-        pattern = r"((?:^|\n)\d+\. [^\n]*\n)((?:(?!\n\d+\. ).)*?)(\n\d+\. |$)"
-        return re.sub(pattern, process_match, text, flags=re.DOTALL)
+        return self.NUMBERED_BLOCK_PATTERN.sub(process_match, text)
 
     def post_condition(self, text: str, ctx: NormalizationContext) -> bool:
         # No double dashes at line start
-        return re.search(r"^(\s*)- - ", text, re.MULTILINE) is None
+        return self.DUPLICATE_DASH_PATTERN.search(text) is None
 
 
 class TableStructurePass(NormalizationPass):
@@ -270,6 +311,13 @@ class TableStructurePass(NormalizationPass):
     - Add blank line after table
     """
 
+    INDENTED_ROW_PATTERN = re.compile(r"\n +\|")
+    LEADING_ROW_INDENT_PATTERN = re.compile(r"^ +\|")
+    # Lookahead leaves the next row's pipe unconsumed, so one pass suffices
+    BLANK_BETWEEN_ROWS_PATTERN = re.compile(r"\|\n\n+(?=\|)")
+    BEFORE_TABLE_PATTERN = re.compile(r"([^\|\n])\n(\|)")
+    AFTER_TABLE_PATTERN = re.compile(r"(\|)\n(?! *\|)([^\n])")
+
     @property
     def name(self) -> str:
         return "TableStructure"
@@ -279,27 +327,23 @@ class TableStructurePass(NormalizationPass):
 
     def action(self, text: str, ctx: NormalizationContext) -> str:
         # Remove indentation from table rows
-        text = re.sub(r"\n +\|", r"\n|", text)
-        text = re.sub(r"^ +\|", "|", text)
+        text = self.INDENTED_ROW_PATTERN.sub(r"\n|", text)
+        text = self.LEADING_ROW_INDENT_PATTERN.sub("|", text)
 
         # Remove blank lines between table rows
-        while True:
-            new_text = re.sub(r"(\|)\n\n+(\|)", r"\1\n\2", text)
-            if new_text == text:
-                break
-            text = new_text
+        text = self.BLANK_BETWEEN_ROWS_PATTERN.sub("|\n", text)
 
         # Add blank line before table
-        text = re.sub(r"([^\|\n])\n(\|)", r"\1\n\n\2", text)
+        text = self.BEFORE_TABLE_PATTERN.sub(r"\1\n\n\2", text)
 
         # Add blank line after table
-        text = re.sub(r"(\|)\n(?! *\|)([^\n])", r"\1\n\n\2", text)
+        text = self.AFTER_TABLE_PATTERN.sub(r"\1\n\n\2", text)
 
         return text
 
     def post_condition(self, text: str, ctx: NormalizationContext) -> bool:
         # No indented table rows
-        return re.search(r"\n +\|", text) is None
+        return self.INDENTED_ROW_PATTERN.search(text) is None
 
 
 class LineContinuationPass(NormalizationPass):
@@ -309,14 +353,19 @@ class LineContinuationPass(NormalizationPass):
     and should be merged with the previous line.
     """
 
+    # (?<!\n) prevents merging after empty lines (paragraph breaks)
+    CONTINUATION_PATTERN = re.compile(r"(?<!\n)\n {1,3}([^-\s])")
+
     @property
     def name(self) -> str:
         return "LineContinuation"
 
+    def pre_condition(self, text: str, ctx: NormalizationContext) -> bool:
+        return "\n " in text
+
     def action(self, text: str, ctx: NormalizationContext) -> str:
         # Line continuation merging (1-3 spaces, not after empty line)
-        # (?<!\n) prevents merging after empty lines (paragraph breaks)
-        return re.sub(r"(?<!\n)\n {1,3}([^-\s])", r" \1", text)
+        return self.CONTINUATION_PATTERN.sub(r" \1", text)
 
     def post_condition(self, text: str, ctx: NormalizationContext) -> bool:
         # No 1-3 space continuations should remain (except after blank lines)
@@ -337,38 +386,48 @@ class WhitespacePass(NormalizationPass):
     Note: Line continuation is handled by LineContinuationPass.
     """
 
+    # Patterns start with a literal so the regex engine can skip ahead to
+    # candidate positions; runs that are already collapsed are not matched.
+    MULTI_SPACE_PATTERN = re.compile(r" (?<=\S ) +")
+    INDENT_AFTER_BLANK_PATTERN = re.compile(r"\n\n( {2,})(?!\d+\.)([^-\s\x00|])")
+    DEEP_INDENT_PATTERN = re.compile(r"\n(?<!\n\n)( {4,})(?!\d+\.)([^-\s\x00|])")
+    # Lookahead leaves the next newline unconsumed, so one pass suffices
+    WHITESPACE_LINE_PATTERN = re.compile(r"\n[ \t]+(?=\n)")
+    MULTI_NEWLINE_PATTERN = re.compile(r"\n\n\n+")
+
     @property
     def name(self) -> str:
         return "Whitespace"
 
+    def pre_condition(self, text: str, ctx: NormalizationContext) -> bool:
+        # Every rewrite below needs one of these substrings or outer whitespace
+        return (
+            "  " in text
+            or "\n " in text
+            or "\n\t" in text
+            or "\n\n\n" in text
+            or text[:1].isspace()
+            or text[-1:].isspace()
+        )
+
     def action(self, text: str, ctx: NormalizationContext) -> str:
         # Collapse multiple spaces (only after non-whitespace)
-        text = re.sub(r"(?<=\S) +", " ", text)
+        text = self.MULTI_SPACE_PATTERN.sub(" ", text)
 
         # Collapse leading spaces (except for list markers, code blocks, tables)
         # Two cases to avoid triggering line continuation in convergence loop:
         # 1. After blank line: any spaces (2+) -> 1 space (safe, won't trigger line cont)
-        text = re.sub(
-            r"\n\n( {2,})(?!\d+\.)([^-\s\x00|])",
-            lambda m: "\n\n " + m.group(2),
-            text,
+        text = self.INDENT_AFTER_BLANK_PATTERN.sub(
+            lambda m: "\n\n " + m.group(2), text
         )
         # 2. Not after blank line: only 4+ spaces -> 1 space (1-3 handled by LineContinuation)
-        text = re.sub(
-            r"(?<!\n)\n( {4,})(?!\d+\.)([^-\s\x00|])",
-            lambda m: "\n " + m.group(2),
-            text,
-        )
+        text = self.DEEP_INDENT_PATTERN.sub(lambda m: "\n " + m.group(2), text)
 
         # Remove whitespace-only lines
-        while True:
-            new_text = re.sub(r"\n[ \t]+\n", "\n", text)
-            if new_text == text:
-                break
-            text = new_text
+        text = self.WHITESPACE_LINE_PATTERN.sub("", text)
 
         # Collapse multiple newlines to double
-        text = re.sub(r"\n\n+", "\n\n", text)
+        text = self.MULTI_NEWLINE_PATTERN.sub("\n\n", text)
 
         # Strip leading/trailing whitespace
         text = text.strip()
@@ -390,10 +449,19 @@ class EscapeSequencePass(NormalizationPass):
     - Unescape \\[ and \\] in headings
     """
 
+    # Heading lines that contain an escaped ".", "[" or "]"
+    ESCAPED_HEADING_PATTERN = re.compile(
+        r"^#{1,6}[^\n]*?\\[.\[\]][^\n]*", re.MULTILINE
+    )
+    HEADING_ESCAPE_PATTERN = re.compile(r"\\([.\[\]])")
+
     @property
     def name(self) -> str:
         return "EscapeSequence"
 
+    def pre_condition(self, text: str, ctx: NormalizationContext) -> bool:
+        return "\\" in text or "\u201c" in text or "\u201d" in text
+
     def action(self, text: str, ctx: NormalizationContext) -> str:
         # Unescape bold markers
         text = text.replace("\\*\\*", "**")
@@ -403,14 +471,8 @@ class EscapeSequencePass(NormalizationPass):
         text = text.replace("\u201d", '"')  # RIGHT DOUBLE QUOTATION MARK
 
         # Unescape in headings only
-        text = re.sub(
-            r"^(#{1,6}[^\n]*?)\\\.", r"\1.", text, flags=re.MULTILINE
-        )
-        text = re.sub(
-            r"^(#{1,6}[^\n]*?)\\\[", r"\1[", text, flags=re.MULTILINE
-        )
-        text = re.sub(
-            r"^(#{1,6}[^\n]*?)\\\]", r"\1]", text, flags=re.MULTILINE
+        text = self.ESCAPED_HEADING_PATTERN.sub(
+            lambda m: self.HEADING_ESCAPE_PATTERN.sub(r"\1", m.group(0)), text
         )
 
         return text
@@ -434,10 +496,15 @@ class CodeBlockRestorationPass(NormalizationPass):
         return len(ctx.code_blocks) > 0
 
     def action(self, text: str, ctx: NormalizationContext) -> str:
-        for i, block in enumerate(ctx.code_blocks):
-            placeholder = ctx.placeholder_base.format(i)
-            text = text.replace(placeholder, block)
-        return text
+        code_blocks = ctx.code_blocks
+
+        # Restore every placeholder in one scan; placeholders nested inside
+        # restored blocks are handled by the next convergence iteration
+        def restore(match):
+            index = int(match.group(1))
+            return code_blocks[index] if index < len(code_blocks) else match.group(0)
+
+        return _placeholder_pattern(ctx.placeholder_base).sub(restore, text)
 
     def post_condition(self, text: str, ctx: NormalizationContext) -> bool:
         # No placeholders should remain
@@ -1,8 +1,9 @@
 """Unified parser for all platforms using standard JSONL format."""
 
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 from chatweave.io.jsonl_loader import load_jsonl
 from chatweave.models.conversation import ArtifactIR, ConversationIR, MessageIR, Platform
@@ -15,6 +16,17 @@ from chatweave.util.text_normalization import (
     normalize_text,
 )
 
+# Fallback timestamp for messages without a parseable one
+_EPOCH = datetime.fromtimestamp(0)
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing "Z" natively
+    _parse_timestamp = datetime.fromisoformat
+else:  # pragma: no cover - exercised only on Python 3.10
+
+    def _parse_timestamp(timestamp_str: str) -> datetime:
+        return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+
 
 class UnifiedParser(ConversationParser):
     """Parser for standard JSONL format used by all platforms.
@@ -23,6 +35,12 @@ class UnifiedParser(ConversationParser):
     the standardized format with _meta line and message lines.
     """
 
+    # Platform-specific cleaners for assistant responses (built once per class)
+    ASSISTANT_CLEANERS: Dict[str, Callable[[str], str]] = {
+        "gemini": clean_gemini_assistant,
+        "grok": clean_grok_assistant,
+    }
+
     def __init__(self):
         """Initialize unified parser."""
         self.platform = "unified"
@@ -117,23 +135,27 @@ class UnifiedParser(ConversationParser):
 
         # Extract fields
         role = msg_data["role"]
+        if type(role) is str:
+            # Share one "user"/"assistant" object across all messages
+            role = sys.intern(role)
         raw_content = msg_data.get("content", "")
         timestamp_str = msg_data.get("timestamp", "")
 
-        # Parse timestamp
-        try:
-            timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            # Fallback to epoch if parsing fails
-            timestamp = datetime.fromtimestamp(0)
+        # Parse timestamp (fallback to epoch if missing or invalid)
+        if not timestamp_str:
+            timestamp = _EPOCH
+        else:
+            try:
+                timestamp = _parse_timestamp(timestamp_str)
+            except (ValueError, TypeError, AttributeError):
+                timestamp = _EPOCH
 
         # Apply platform-specific cleaning for assistant responses
         content_to_normalize = raw_content
         if role == "assistant" and raw_content:
-            if platform == "gemini":
-                content_to_normalize = clean_gemini_assistant(raw_content)
-            elif platform == "grok":
-                content_to_normalize = clean_grok_assistant(raw_content)
+            cleaner = self.ASSISTANT_CLEANERS.get(platform)
+            if cleaner is not None:
+                content_to_normalize = cleaner(raw_content)
 
         # Normalize content
         normalized_content = (
@@ -166,13 +188,11 @@ class UnifiedParser(ConversationParser):
             ArtifactIR object
         """
         artifact_id = f"a{index:04d}"
-        title = artifact_data.get("title", "")
-        version = artifact_data.get("version")
-        content = artifact_data.get("content", "")
-
-        # Remaining fields go into meta
-        known_keys = {"title", "version", "content"}
-        meta = {k: v for k, v in artifact_data.items() if k not in known_keys}
+        # Pop known fields from a copy; remaining fields go into meta
+        meta = dict(artifact_data)
+        title = meta.pop("title", "")
+        version = meta.pop("version", None)
+        content = meta.pop("content", "")
 
         return ArtifactIR(
             id=artifact_id,
@@ -112,16 +112,18 @@ def _create_qa_unit(
     """
     qa_id = f"q{index:04d}"
 
-    # Extract message IDs
-    user_message_ids = [msg.id for msg in user_messages]
+    # Collect user message IDs and non-empty contents in one pass
+    user_message_ids = []
+    user_contents = []
+    for msg in user_messages:
+        user_message_ids.append(msg.id)
+        content = msg.raw_content
+        if content:
+            user_contents.append(content)
     assistant_message_ids = [msg.id for msg in assistant_messages]
 
     # Get question from user (combine if multiple messages)
-    question_from_user = None
-    if user_messages:
-        user_contents = [msg.raw_content for msg in user_messages if msg.raw_content]
-        if user_contents:
-            question_from_user = "\n\n".join(user_contents)
+    question_from_user = "\n\n".join(user_contents) if user_contents else None
 
     # Extract question summary from assistant response
     question_from_assistant_summary = None
@@ -132,8 +134,8 @@ def _create_qa_unit(
 
     # Get query hash from first user message
     user_query_hash = None
-    if user_messages and user_messages[0].query_hash:
-        user_query_hash = user_messages[0].query_hash
+    if user_messages:
+        user_query_hash = user_messages[0].query_hash or None
 
     return QAUnit(
         qa_id=qa_id,
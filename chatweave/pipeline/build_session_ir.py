@@ -1,5 +1,6 @@
 """Pipeline for building MultiModelSessionIR from multiple QAUnitIR."""
 
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
 from chatweave.matchers.base import QueryMatcher
@@ -11,6 +12,9 @@ from chatweave.models.session import (
     PromptGroup,
 )
 
+# Sort key for canonical unit selection
+_platform_key = attrgetter("platform")
+
 
 def build_session_ir(
     qa_units: Dict[str, QAUnitIR],
@@ -76,13 +80,10 @@ def _build_conversation_list(qa_units: Dict[str, QAUnitIR]) -> List[Dict[str, st
     Returns:
         List of dicts with platform and conversation_id
     """
-    conversations = []
-    for platform, qa_ir in qa_units.items():
-        conversations.append({
-            "platform": platform,
-            "conversation_id": qa_ir.conversation_id,
-        })
-    return conversations
+    return [
+        {"platform": platform, "conversation_id": qa_ir.conversation_id}
+        for platform, qa_ir in qa_units.items()
+    ]
 
 
 def _create_prompt_groups(
@@ -100,6 +101,13 @@ def _create_prompt_groups(
     """
     prompts = []
 
+    # QA unit count per platform, computed once for missing_context checks
+    platform_lengths = {
+        platform: len(qa_unit_ir.qa_units) for platform, qa_unit_ir in qa_units.items()
+    }
+
+    previous_key = None
+
     for index, group in enumerate(groups):
         prompt_key = f"p{index:04d}"
 
@@ -111,12 +119,14 @@ def _create_prompt_groups(
 
         # Build depends_on (sequential dependency)
         depends_on = []
-        if index > 0:
+        dep_indices = []
+        if previous_key is not None:
             # This prompt depends on the previous one
-            depends_on = [f"p{index - 1:04d}"]
+            depends_on = [previous_key]
+            dep_indices = [index - 1]
 
         # Build per-platform references
-        per_platform = _build_per_platform_refs(group, depends_on, qa_units)
+        per_platform = _build_per_platform_refs(group, dep_indices, platform_lengths)
 
         prompt_group = PromptGroup(
             prompt_key=prompt_key,
@@ -125,6 +135,7 @@ def _create_prompt_groups(
             per_platform=per_platform,
         )
         prompts.append(prompt_group)
+        previous_key = prompt_key
 
     return prompts
 
@@ -140,9 +151,8 @@ def _select_canonical_unit(group: List[QAUnit]) -> QAUnit:
     Returns:
         Selected canonical QAUnit
     """
-    # Sort by platform alphabetically
-    sorted_units = sorted(group, key=lambda u: u.platform)
-    return sorted_units[0]
+    # Alphabetically first platform; min keeps the first unit on ties like a stable sort
+    return min(group, key=_platform_key)
 
 
 def _build_canonical_prompt(unit: QAUnit) -> Dict[str, Any]:
@@ -171,15 +181,16 @@ def _build_canonical_prompt(unit: QAUnit) -> Dict[str, Any]:
 
 def _build_per_platform_refs(
     group: List[QAUnit],
-    depends_on: List[str],
-    qa_units: Dict[str, QAUnitIR],
+    dep_indices: List[int],
+    platform_lengths: Dict[str, int],
 ) -> List[PerPlatformQARef]:
     """Build per-platform QA references.
 
     Args:
         group: List of QA units in this prompt group
-        depends_on: List of prompt_keys this depends on
-        qa_units: Dict mapping platform to QAUnitIR (for missing_context check)
+        dep_indices: Indices of the prompts this depends on (e.g., 0 for "p0000")
+        platform_lengths: Dict mapping platform to its QA unit count
+            (for missing_context check)
 
     Returns:
         List of PerPlatformQARef objects
@@ -201,16 +212,11 @@ def _build_per_platform_refs(
         # If this prompt depends on previous prompts, check if this platform
         # has those dependent QA units
         missing_context = False
-        if depends_on:
-            # Get the dependent prompt index (e.g., "p0000" -> 0)
-            for dep_key in depends_on:
-                dep_index = int(dep_key[1:])  # Remove 'p' prefix
-                # Check if this platform has a QA unit at that index
-                platform_qa_ir = qa_units.get(unit.platform)
-                if platform_qa_ir and dep_index < len(platform_qa_ir.qa_units):
-                    # Context exists
-                    pass
-                else:
+        if dep_indices:
+            # Check if this platform has a QA unit at each dependent index
+            platform_length = platform_lengths.get(unit.platform, 0)
+            for dep_index in dep_indices:
+                if dep_index >= platform_length:
                     missing_context = True
                     break
 
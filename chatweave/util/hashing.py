@@ -1,6 +1,6 @@
 """Hashing utilities for generating query identifiers."""
 
-import hashlib
+from hashlib import sha256
 
 
 def compute_query_hash(text: str) -> str:
@@ -18,11 +18,5 @@ def compute_query_hash(text: str) -> str:
     if not text:
         return ""
 
-    # Encode text to UTF-8 bytes
-    text_bytes = text.encode("utf-8")
-
-    # Compute SHA256 hash
-    hash_obj = hashlib.sha256(text_bytes)
-
-    # Return hexadecimal digest
-    return hash_obj.hexdigest()
+    # Hash the UTF-8 bytes and return the hexadecimal digest
+    return sha256(text.encode("utf-8")).hexdigest()
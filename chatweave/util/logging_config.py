@@ -3,7 +3,10 @@
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+# (config, handlers) installed by the last setup_logging call
+_applied: Optional[Tuple[tuple, Tuple[logging.Handler, ...]]] = None
 
 
 def setup_logging(
@@ -13,6 +16,9 @@ def setup_logging(
 ) -> logging.Logger:
     """Configure logging for CLI.
 
+    Repeated calls with the same arguments (and the same sys.stdout) keep
+    the handlers installed by the previous call instead of rebuilding them.
+
     Args:
         verbose: Enable DEBUG level for console
         quiet: Suppress console output entirely
@@ -29,10 +35,24 @@ def setup_logging(
         >>> logger = setup_logging(quiet=True, log_file=Path("app.log"))
         >>> logger.info("This goes to file only")
     """
+    global _applied
+
     logger = logging.getLogger("chatweave")
+
+    # Nothing to do if our handlers from an identical call are still in place
+    config = (verbose, quiet, log_file, sys.stdout)
+    if (
+        _applied is not None
+        and _applied[0] == config
+        and tuple(logger.handlers) == _applied[1]
+    ):
+        return logger
+
     logger.setLevel(logging.DEBUG)  # Capture all, handlers filter
 
-    # Clear existing handlers
+    # Close (releasing any open log file) and clear existing handlers
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
 
     # Prevent propagation to root logger
@@ -60,4 +80,5 @@ def setup_logging(
         file_handler.setFormatter(file_formatter)
         logger.addHandler(file_handler)
 
+    _applied = (config, tuple(logger.handlers))
     return logger
@@ -1,20 +1,17 @@
 """Platform inference from filename and metadata."""
 
 import re
+import sys
 from pathlib import Path
 from typing import Optional
 
 from chatweave.models.conversation import Platform
 
 
-# Filename patterns for platform inference
-PLATFORM_PATTERNS = {
-    "chatgpt": re.compile(r"^chatgpt[_-]", re.IGNORECASE),
-    "claude": re.compile(r"^claude[_-]", re.IGNORECASE),
-    "gemini": re.compile(r"^gemini[_-]", re.IGNORECASE),
-    "grok": re.compile(r"^grok[_-]", re.IGNORECASE),
-    "perplexity": re.compile(r"^perplexity[_-]", re.IGNORECASE),
-}
+# Filename prefix pattern for platform inference (one match per filename)
+PLATFORM_PATTERN = re.compile(
+    r"^(chatgpt|claude|gemini|grok|perplexity)[_-]", re.IGNORECASE
+)
 
 
 def infer_platform_from_filename(filename: str) -> Optional[Platform]:
@@ -24,6 +21,8 @@ def infer_platform_from_filename(filename: str) -> Optional[Platform]:
         - chatgpt_*.jsonl -> chatgpt
         - claude_*.jsonl -> claude
         - gemini_*.jsonl -> gemini
+        - grok_*.jsonl -> grok
+        - perplexity_*.jsonl -> perplexity
 
     Args:
         filename: Name of the file (not full path)
@@ -39,10 +38,11 @@ def infer_platform_from_filename(filename: str) -> Optional[Platform]:
         >>> infer_platform_from_filename("unknown.jsonl")
         None
     """
-    for platform, pattern in PLATFORM_PATTERNS.items():
-        if pattern.match(filename):
-            return platform  # type: ignore
-    return None
+    match = PLATFORM_PATTERN.match(filename)
+    if match is None:
+        return None
+    # Interned like metadata platforms so IR objects share one string
+    return sys.intern(match.group(1).lower())  # type: ignore
 
 
 def infer_platform(
@@ -80,7 +80,8 @@ def infer_platform(
     if metadata and metadata.get("platform"):
         platform = metadata.get("platform")
         if platform in ("chatgpt", "claude", "gemini", "grok", "perplexity"):
-            return platform  # type: ignore
+            # Interned so every IR object of this conversation shares it
+            return sys.intern(platform)  # type: ignore
 
     # Priority 3: Filename
     platform = infer_platform_from_filename(jsonl_path.name)
@@ -1,16 +1,43 @@
 """Progress tracking for CLI operations."""
 
 import json
+import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
 StepName = Literal["parse", "build_qa_ir", "build_session_ir", "write_output"]
 StepStatus = Literal["pending", "in_progress", "completed", "error"]
 OverallStatus = Literal["pending", "in_progress", "completed", "error"]
 
 
+def _dumps(data: Dict[str, Any], indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 encoded JSON bytes.
+
+    Uses orjson when it is installed; its 2-space indented output is
+    identical to the stdlib encoder's.
+
+    Args:
+        data: JSON-serializable dict
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
 @dataclass
 class ProgressStep:
     """Individual progress step.
@@ -49,13 +76,26 @@ class ProgressTracker:
 
     Writes progress.json to output directory with step-by-step status.
 
+    In buffered mode, intermediate updates are appended as single events to
+    progress.log.jsonl and progress.json is only written on complete/fail.
+    The first event of a run truncates the log and writes an in_progress
+    progress.json, so no state from a previous run is left behind.
+
+    progress.json is replaced atomically, so readers never see partial JSON.
+
     Attributes:
         output_dir: Directory where progress.json will be written
         enabled: Whether to write progress file (default: True)
+        buffered: Append step events instead of rewriting progress.json
+        min_write_interval: Minimum seconds between intermediate rewrites of
+            progress.json (0 rewrites on every update); complete/fail
+            always write
     """
 
     output_dir: Path
     enabled: bool = True
+    buffered: bool = False
+    min_write_interval: float = 0.0
 
     # Internal state
     started_at: datetime = field(default_factory=datetime.now)
@@ -64,6 +104,8 @@ class ProgressTracker:
     steps: List[ProgressStep] = field(default_factory=list)
     output_info: Dict[str, Any] = field(default_factory=dict)
     error: Optional[str] = None
+    _last_write: float = field(default=0.0, init=False, repr=False)
+    _log_started: bool = field(default=False, init=False, repr=False)
 
     def __post_init__(self):
         """Initialize steps."""
@@ -83,7 +125,7 @@ class ProgressTracker:
             files: List of files being processed
         """
         self.input_info = {"type": input_type, "path": path, "files": files}
-        self._write()
+        self._update("set_input", input=self.input_info)
 
     def start_step(self, name: StepName, details: Optional[Dict] = None):
         """Mark step as started.
@@ -98,7 +140,7 @@ class ProgressTracker:
         if details:
             step.details.update(details)
         self.status = "in_progress"
-        self._write()
+        self._update("start_step", step=name, details=details)
 
     def complete_step(self, name: StepName, details: Optional[Dict] = None):
         """Mark step as completed.
@@ -112,7 +154,7 @@ class ProgressTracker:
         step.completed_at = datetime.now()
         if details:
             step.details.update(details)
-        self._write()
+        self._update("complete_step", step=name, details=details)
 
     def fail_step(self, name: StepName, error: str):
         """Mark step as failed.
@@ -165,6 +207,42 @@ class ProgressTracker:
                 return step
         raise ValueError(f"Unknown step: {name}")
 
+    def _update(self, event: str, **fields: Any):
+        """Record an intermediate update.
+
+        Rewrites progress.json (at most once per min_write_interval), or in
+        buffered mode appends one event line to progress.log.jsonl.
+
+        Args:
+            event: Event name (e.g., "start_step")
+            **fields: Event-specific fields
+        """
+        if not self.buffered:
+            if (
+                self.min_write_interval
+                and time.monotonic() - self._last_write < self.min_write_interval
+            ):
+                # Debounced; a later update or complete/fail writes this state
+                return
+            self._write()
+            return
+
+        if not self.enabled:
+            return
+
+        if not self._log_started:
+            # New run: replace the previous run's progress.json and log
+            self.status = "in_progress"
+            self._write()
+            mode = "wb"
+            self._log_started = True
+        else:
+            mode = "ab"
+
+        record = {"time": datetime.now().isoformat(), "event": event, **fields}
+        with open(self.output_dir / "progress.log.jsonl", mode) as f:
+            f.write(_dumps(record) + b"\n")
+
     def _write(self):
         """Write progress to progress.json file."""
         if not self.enabled:
@@ -184,5 +262,9 @@ class ProgressTracker:
             "error": self.error,
         }
 
-        with open(progress_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Write to a temp file and rename over progress.json atomically
+        tmp_path = progress_path.with_name("progress.json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(data, indent=True))
+        os.replace(tmp_path, progress_path)
+        self._last_write = time.monotonic()
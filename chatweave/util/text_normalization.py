@@ -6,16 +6,32 @@ normalization system in chatweave.normalization.
 
 import re
 
-from chatweave.normalization import NormalizationContext, create_default_runner
-
-# Lazy-initialized default runner
+# Lazy-initialized default runner; chatweave.normalization (which compiles
+# every pass pattern) is only imported on first use
 _default_runner = None
 
+# Platform cleaner patterns, compiled once at import
+_GEMINI_THINKING_PATTERN = re.compile(r"^생각하는 과정 표시\s*\n+")
+_GEMINI_SHEETS_EXPORT_PATTERN = re.compile(r"\n+Sheets로 내보내기\s*\n*")
+_GEMINI_CODE_SNIPPET_PATTERN = re.compile(r"\n*코드 스니펫\s*\n+")
+_GEMINI_SOURCES_PATTERN = re.compile(r"\n+소스\s*$")
+_GROK_THINKING_PATTERN = re.compile(r"^\d+s동안 생각함\s*\n+")
+# Pattern: multiple lines of ![](url) followed by "N개의 웹페이지" text
+# This handles both simple and complex patterns:
+# - Simple: images + "1개의 웹페이지 31개의 웹페이지"
+# - Complex: images + "𝕏 게시물 N개" + more images + "N개의 웹페이지"
+_GROK_WEB_FOOTER_PATTERN = re.compile(
+    r"(\n*!\[\]\([^\)]+\)\s*)+(\n*𝕏 게시물[^\n]*)?(\n*!\[\]\([^\)]+\)\s*)*\n*\d+개의 웹페이지[^\n]*$",
+    re.DOTALL,
+)
+
 
 def _get_runner():
     """Get or create the default PassRunner instance."""
     global _default_runner
     if _default_runner is None:
+        from chatweave.normalization import create_default_runner
+
         _default_runner = create_default_runner()
     return _default_runner
 
@@ -41,9 +57,8 @@ def normalize_text(text: str) -> str:
     if not text:
         return text
 
-    runner = _get_runner()
-    ctx = NormalizationContext()
-    return runner.run(text, ctx)
+    # The runner creates a fresh NormalizationContext for each run
+    return _get_runner().run(text)
 
 
 def clean_gemini_assistant(text: str) -> str:
@@ -64,17 +79,23 @@ def clean_gemini_assistant(text: str) -> str:
     if not text:
         return text
 
+    # Each marker is checked with a substring test before its regex scan
+
     # Remove "생각하는 과정 표시" at the beginning
-    text = re.sub(r"^생각하는 과정 표시\s*\n+", "", text)
+    if text.startswith("생각하는 과정 표시"):
+        text = _GEMINI_THINKING_PATTERN.sub("", text)
 
     # Remove "Sheets로 내보내기" after tables (standalone line)
-    text = re.sub(r"\n+Sheets로 내보내기\s*\n*", "\n", text)
+    if "Sheets로 내보내기" in text:
+        text = _GEMINI_SHEETS_EXPORT_PATTERN.sub("\n", text)
 
     # Remove "코드 스니펫" before code blocks (standalone line)
-    text = re.sub(r"\n*코드 스니펫\s*\n+", "\n\n", text)
+    if "코드 스니펫" in text:
+        text = _GEMINI_CODE_SNIPPET_PATTERN.sub("\n\n", text)
 
     # Remove "소스" at the end
-    text = re.sub(r"\n+소스\s*$", "", text)
+    if "소스" in text:
+        text = _GEMINI_SOURCES_PATTERN.sub("", text)
 
     return text
 
@@ -96,14 +117,11 @@ def clean_grok_assistant(text: str) -> str:
         return text
 
     # Remove "Ns동안 생각함" at the beginning (e.g., "27s동안 생각함", "5s동안 생각함")
-    text = re.sub(r"^\d+s동안 생각함\s*\n+", "", text)
+    if text[:1].isdigit():
+        text = _GROK_THINKING_PATTERN.sub("", text)
 
     # Remove favicon images and web page count footer at the end
-    # Pattern: multiple lines of ![](url) followed by "N개의 웹페이지" text
-    # This handles both simple and complex patterns:
-    # - Simple: images + "1개의 웹페이지 31개의 웹페이지"
-    # - Complex: images + "𝕏 게시물 N개" + more images + "N개의 웹페이지"
-    pattern = r"(\n*!\[\]\([^\)]+\)\s*)+(\n*𝕏 게시물[^\n]*)?(\n*!\[\]\([^\)]+\)\s*)*\n*\d+개의 웹페이지[^\n]*$"
-    text = re.sub(pattern, "", text, flags=re.DOTALL)
+    if "개의 웹페이지" in text:
+        text = _GROK_WEB_FOOTER_PATTERN.sub("", text)
 
     return text
@@ -235,3 +235,88 @@ Second summary (should not be matched).
 
         assert result == "First summary."
         assert "Second summary" not in result
+
+    def test_pattern_priority_over_earlier_heading(self):
+        """Test that a higher-priority heading wins even when it comes later."""
+        extractor = HeuristicQueryExtractor()
+        content = "## 질문 정리\n\nPlain summary.\n\n## 1. 질문 정리\n\nNumbered summary.\n"
+
+        assert extractor.extract(content) == "Numbered summary."
+
+    def test_gear_emoji_pattern(self):
+        """Test extraction of '## ⚙️ 질문 정리' pattern."""
+        extractor = HeuristicQueryExtractor()
+        content = """## ⚙️ 질문 정리
+
+설정 관련 질문입니다.
+
+---
+
+## 답변
+"""
+        result = extractor.extract(content)
+
+        assert result == "설정 관련 질문입니다."
+
+    def test_earliest_end_marker_wins(self):
+        """Test that the section ends at the earliest end marker."""
+        extractor = HeuristicQueryExtractor()
+        content = """## 질문 정리
+
+Summary line.
+
+---
+
+Still not summary.
+
+* * *
+
+## Next
+"""
+        result = extractor.extract(content)
+
+        assert result == "Summary line."
+
+    def test_long_blank_line_run_collapsed(self):
+        """Test that long runs of blank lines collapse to one paragraph break."""
+        extractor = HeuristicQueryExtractor()
+        content = "## 질문 정리\n\nFirst." + "\n" * 20 + "Second.\n\n* * *\n"
+
+        result = extractor.extract(content)
+
+        assert result == "First.\n\nSecond."
+
+    def test_clean_content_strips_each_line(self):
+        """Test that surrounding whitespace is stripped from every line."""
+        extractor = HeuristicQueryExtractor()
+
+        result = extractor._clean_content(" first \t\n\t second  \n   \n third　")
+
+        assert result == "first\nsecond\n\nthird"
+
+    def test_no_heading_marker_returns_none(self):
+        """Test that content without a '##' heading returns None."""
+        extractor = HeuristicQueryExtractor()
+
+        assert extractor.extract("질문 정리\n\nNo heading marker here.") is None
+        assert extractor.extract("## Heading\n\nNo summary keyword.") is None
+
+    def test_heading_without_trailing_newline(self):
+        """Test that a heading on the last line yields no summary."""
+        extractor = HeuristicQueryExtractor()
+
+        assert extractor.extract("Intro\n\n## 질문 정리 (Context)") is None
+
+    def test_end_marker_directly_after_heading(self):
+        """Test that an end marker on the line after the heading is honored."""
+        extractor = HeuristicQueryExtractor()
+
+        assert extractor.extract("## 질문 정리\n---\nNot the summary.") is None
+
+    def test_clean_content_adjacent_escapes(self):
+        """Test that adjacent escapes are unescaped in a single pass."""
+        extractor = HeuristicQueryExtractor()
+
+        result = extractor._clean_content("\\[\\*\\-\\]")
+
+        assert result == "[*-]"
@@ -11,7 +11,7 @@ from chatweave.io.ir_writer import (
     write_qa_unit_ir,
     write_session_ir,
 )
-from chatweave.models.conversation import ConversationIR, MessageIR
+from chatweave.models.conversation import ArtifactIR, ConversationIR, MessageIR
 from chatweave.models.qa_unit import QAUnit, QAUnitIR
 from chatweave.models.session import (
     MultiModelSessionIR,
@@ -561,3 +561,325 @@ class TestWriteSessionIR:
         assert output_path1.exists()
         assert output_path2.exists()
         assert output_path3.exists()
+
+
+class TestJsonBackend:
+    """Tests for the JSON serialization backend selection."""
+
+    def _make_conversation_ir(self):
+        return ConversationIR(
+            platform="claude",
+            conversation_id="backend",
+            meta={"title": "한글 제목"},
+            messages=[
+                MessageIR(
+                    id="m0000",
+                    index=0,
+                    role="user",
+                    timestamp=datetime(2025, 11, 29, 10, 0, 0),
+                    raw_content="안녕하세요",
+                    normalized_content="안녕하세요",
+                )
+            ],
+        )
+
+    def test_stdlib_fallback_matches_default_output(self, tmp_path, monkeypatch):
+        """Test that the stdlib fallback writes the same JSON document."""
+        import chatweave.io.ir_writer as ir_writer
+
+        conversation_ir = self._make_conversation_ir()
+        default_path = write_conversation_ir(conversation_ir, tmp_path / "default")
+
+        monkeypatch.setattr(ir_writer, "orjson", None)
+        fallback_path = write_conversation_ir(conversation_ir, tmp_path / "fallback")
+
+        default_data = json.loads(default_path.read_text(encoding="utf-8"))
+        fallback_data = json.loads(fallback_path.read_text(encoding="utf-8"))
+        assert default_data == fallback_data
+        assert "안녕하세요" in fallback_path.read_text(encoding="utf-8")
+
+    def test_compact_by_default(self, tmp_path):
+        """Test that output is compact unless an indent is requested."""
+        conversation_ir = self._make_conversation_ir()
+
+        output_path = write_conversation_ir(conversation_ir, tmp_path)
+
+        content = output_path.read_text(encoding="utf-8")
+        assert "\n" not in content
+        assert '"schema":"conversation-ir/v1"' in content
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_stdlib_fallback_layout_matches(self, tmp_path, monkeypatch, indent):
+        """Test that orjson and stdlib produce byte-identical layouts."""
+        import chatweave.io.ir_writer as ir_writer
+
+        conversation_ir = self._make_conversation_ir()
+        default_path = write_conversation_ir(
+            conversation_ir, tmp_path / "default", indent=indent
+        )
+
+        monkeypatch.setattr(ir_writer, "orjson", None)
+        fallback_path = write_conversation_ir(
+            conversation_ir, tmp_path / "fallback", indent=indent
+        )
+
+        assert default_path.read_bytes() == fallback_path.read_bytes()
+
+    def test_custom_indent(self, tmp_path):
+        """Test that non-default indent levels are honored."""
+        conversation_ir = self._make_conversation_ir()
+
+        output_path = write_conversation_ir(conversation_ir, tmp_path, indent=4)
+
+        content = output_path.read_text(encoding="utf-8")
+        assert '\n    "schema"' in content
+
+
+class TestSessionIRStreaming:
+    """Tests for streamed SessionIR serialization."""
+
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_streamed_output_matches_to_dict(self, tmp_path, indent):
+        """Test that streamed output is identical to dumping to_dict()."""
+        session_ir = MultiModelSessionIR(
+            session_id="stream",
+            platforms=["chatgpt", "claude"],
+            conversations=[
+                {"platform": "chatgpt", "conversation_id": "c1"},
+                {"platform": "claude", "conversation_id": "c2"},
+            ],
+            prompts=[
+                PromptGroup(
+                    prompt_key=f"p{i:04d}",
+                    canonical_prompt={"text": f"질문 {i}\n둘째 줄", "language": None},
+                    depends_on=[f"p{i - 1:04d}"] if i else [],
+                    per_platform=[
+                        PerPlatformQARef(
+                            platform="chatgpt",
+                            qa_id=f"q{i:04d}",
+                            conversation_id="c1",
+                            prompt_similarity=1.0,
+                        )
+                    ],
+                )
+                for i in range(3)
+            ],
+            meta={"note": "x"},
+        )
+
+        output_path = write_session_ir(session_ir, tmp_path, indent=indent)
+
+        separators = (",", ":") if indent is None else None
+        expected = json.dumps(
+            session_ir.to_dict(),
+            indent=indent,
+            separators=separators,
+            ensure_ascii=False,
+        )
+        assert output_path.read_text(encoding="utf-8") == expected
+
+    def test_streamed_output_without_prompts(self, tmp_path):
+        """Test that an empty prompt list is written as an empty array."""
+        session_ir = MultiModelSessionIR(
+            session_id="empty", platforms=[], conversations=[], prompts=[]
+        )
+
+        compact_path = write_session_ir(session_ir, tmp_path)
+        pretty_path = write_session_ir(session_ir, tmp_path, indent=2)
+
+        data = session_ir.to_dict()
+        assert compact_path.read_text(encoding="utf-8") == json.dumps(
+            data, separators=(",", ":"), ensure_ascii=False
+        )
+        assert pretty_path.read_text(encoding="utf-8") == json.dumps(
+            data, indent=2, ensure_ascii=False
+        )
+
+
+class TestGetUniquePath:
+    """Tests for _get_unique_path helper."""
+
+    def test_returns_base_path_when_free(self, tmp_path):
+        """Test that the base filename is used when it does not exist."""
+        from chatweave.io.ir_writer import _get_unique_path
+
+        assert _get_unique_path(tmp_path, "mms_s") == tmp_path / "mms_s.json"
+
+    def test_fills_first_free_suffix(self, tmp_path):
+        """Test that the lowest unused numeric suffix is chosen."""
+        from chatweave.io.ir_writer import _get_unique_path
+
+        for name in ["mms_s.json", "mms_s_1.json", "mms_s_3.json"]:
+            (tmp_path / name).write_text("{}")
+
+        assert _get_unique_path(tmp_path, "mms_s") == tmp_path / "mms_s_2.json"
+
+    def test_taken_names_are_reserved(self, tmp_path):
+        """Test that names in taken are skipped and the chosen name is added."""
+        from chatweave.io.ir_writer import _get_unique_path
+
+        taken = {"mms_s.json"}
+
+        assert _get_unique_path(tmp_path, "mms_s", taken=taken) == tmp_path / "mms_s_1.json"
+        assert _get_unique_path(tmp_path, "mms_s", taken=taken) == tmp_path / "mms_s_2.json"
+        assert taken == {"mms_s.json", "mms_s_1.json", "mms_s_2.json"}
+
+
+class TestAtomicWrite:
+    """Tests for atomic IR file writes."""
+
+    def test_no_temp_files_left_behind(self, tmp_path):
+        """Test that only the final file remains after a write."""
+        session_ir = MultiModelSessionIR(
+            session_id="atomic", platforms=[], conversations=[], prompts=[]
+        )
+
+        output_path = write_session_ir(session_ir, tmp_path)
+
+        assert list(tmp_path.iterdir()) == [output_path]
+
+    def test_failed_write_leaves_no_file(self, tmp_path, monkeypatch):
+        """Test that a failing serialization leaves neither output nor temp file."""
+        import chatweave.io.ir_writer as ir_writer
+
+        def failing_dumps(data, indent=None):
+            raise TypeError("not serializable")
+
+        monkeypatch.setattr(ir_writer, "_dumps", failing_dumps)
+        conversation_ir = ConversationIR(
+            platform="chatgpt", conversation_id="broken", meta={}, messages=[]
+        )
+
+        with pytest.raises(TypeError):
+            write_conversation_ir(conversation_ir, tmp_path)
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestStreamedOutputMatchesToDict:
+    """Tests that streamed ConversationIR/QAUnitIR output equals to_dict()."""
+
+    @staticmethod
+    def _expected(ir, indent):
+        separators = (",", ":") if indent is None else None
+        return json.dumps(
+            ir.to_dict(), indent=indent, separators=separators, ensure_ascii=False
+        )
+
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    @pytest.mark.parametrize("with_artifacts", [False, True])
+    def test_conversation_ir(self, tmp_path, indent, with_artifacts):
+        """Test ConversationIR output with and without artifacts."""
+        conversation_ir = ConversationIR(
+            platform="claude",
+            conversation_id="conv",
+            meta={"url": "https://claude.ai/chat/conv"},
+            messages=[
+                MessageIR(
+                    id=f"m{i:04d}",
+                    index=i,
+                    role="user" if i % 2 == 0 else "assistant",
+                    timestamp=datetime(2025, 11, 29, 10, 0, i),
+                    raw_content=f"메시지 {i}\n줄바꿈",
+                    normalized_content=f"메시지 {i}",
+                )
+                for i in range(3)
+            ],
+            artifacts=(
+                [ArtifactIR(id="a0000", title="Doc", version="v1", content="x")]
+                if with_artifacts
+                else []
+            ),
+        )
+
+        output_path = write_conversation_ir(conversation_ir, tmp_path, indent=indent)
+
+        assert output_path.read_text(encoding="utf-8") == self._expected(
+            conversation_ir, indent
+        )
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_qa_unit_ir(self, tmp_path, indent):
+        """Test QAUnitIR output, including an empty unit list."""
+        for qa_units in ([], [
+            QAUnit(
+                qa_id="q0000",
+                platform="chatgpt",
+                conversation_id="conv",
+                user_message_ids=["m0000"],
+                assistant_message_ids=["m0001"],
+                question_from_user="질문",
+            )
+        ]):
+            qa_unit_ir = QAUnitIR(platform="chatgpt", conversation_id="conv", qa_units=qa_units)
+
+            output_path = write_qa_unit_ir(qa_unit_ir, tmp_path, indent=indent)
+
+            assert output_path.read_text(encoding="utf-8") == self._expected(
+                qa_unit_ir, indent
+            )
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_models_encoded_without_to_dict_match(
+        self, tmp_path, monkeypatch, use_orjson, indent
+    ):
+        """Test that passing models straight to the encoder matches to_dict()."""
+        import chatweave.io.ir_writer as ir_writer
+
+        if not use_orjson:
+            monkeypatch.setattr(ir_writer, "orjson", None)
+
+        conversation_ir = ConversationIR(
+            platform="chatgpt",
+            conversation_id="tz",
+            meta={},
+            messages=[
+                MessageIR(
+                    id="m0000",
+                    index=0,
+                    role="user",
+                    timestamp=datetime.fromisoformat("2025-11-29T10:00:00.123456+09:00"),
+                    raw_content="질문",
+                    query_hash="abc",
+                    meta={"n": 1},
+                ),
+                MessageIR(
+                    id="m0001",
+                    index=1,
+                    role="assistant",
+                    timestamp=datetime.fromisoformat("2025-11-29T10:00:05+00:00"),
+                    raw_content="답변",
+                ),
+            ],
+        )
+        session_ir = MultiModelSessionIR(
+            session_id="s",
+            platforms=["chatgpt", "claude"],
+            conversations=[{"platform": "chatgpt", "conversation_id": "tz"}],
+            prompts=[
+                PromptGroup(
+                    prompt_key="p0000",
+                    canonical_prompt={"text": "질문", "language": "ko"},
+                    depends_on=["p0001"],
+                    per_platform=[
+                        PerPlatformQARef(
+                            platform="chatgpt",
+                            qa_id="q0000",
+                            conversation_id="tz",
+                            prompt_similarity=0.5,
+                        )
+                    ],
+                )
+            ],
+        )
+
+        conv_path = write_conversation_ir(conversation_ir, tmp_path, indent=indent)
+        session_path = write_session_ir(session_ir, tmp_path, indent=indent)
+
+        assert conv_path.read_text(encoding="utf-8") == self._expected(
+            conversation_ir, indent
+        )
+        assert session_path.read_text(encoding="utf-8") == self._expected(
+            session_ir, indent
+        )
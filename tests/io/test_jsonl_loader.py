@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from chatweave.io.jsonl_loader import load_jsonl
+from chatweave.io.jsonl_loader import load_jsonl, load_jsonl_batch
 
 
 class TestLoadJsonl:
@@ -58,6 +58,32 @@ class TestLoadJsonl:
         with pytest.raises(json.JSONDecodeError):
             load_jsonl(jsonl_file)
 
+    def test_invalid_json_reports_line_number(self, tmp_path):
+        """Test that the decode error names the offending line."""
+        jsonl_file = tmp_path / "invalid.jsonl"
+        with open(jsonl_file, "w", encoding="utf-8") as f:
+            f.write('{"_meta": true, "platform": "chatgpt"}\n')
+            f.write("\n")
+            f.write("not valid json\n")
+
+        with pytest.raises(json.JSONDecodeError, match="Invalid JSON at line 3"):
+            load_jsonl(jsonl_file)
+
+    def test_stdlib_fallback_matches(self, tmp_path, monkeypatch):
+        """Test that the stdlib json fallback yields the same result."""
+        from chatweave.io import jsonl_loader
+
+        jsonl_file = tmp_path / "fallback.jsonl"
+        with open(jsonl_file, "w", encoding="utf-8") as f:
+            f.write('{"_meta": true, "platform": "chatgpt"}\n')
+            f.write('{"role": "user", "content": "안녕하세요 👋"}\n')
+            f.write('{"_artifact": true, "title": "t", "content": "c"}\n')
+
+        expected = load_jsonl(jsonl_file)
+        monkeypatch.setattr(jsonl_loader, "_loads", json.loads)
+
+        assert load_jsonl(jsonl_file) == expected
+
     def test_missing_role_in_message(self, tmp_path):
         """Test that ValueError is raised when message lacks 'role' field."""
         jsonl_file = tmp_path / "no_role.jsonl"
@@ -114,6 +140,22 @@ class TestLoadJsonl:
         assert len(messages) == 0
         assert len(artifacts) == 0
 
+    def test_lines_spanning_read_buffer(self, tmp_path):
+        """Test that lines longer than the read buffer are loaded intact."""
+        from chatweave.io.jsonl_loader import READ_BUFFER_SIZE
+
+        long_content = "가" * READ_BUFFER_SIZE
+        jsonl_file = tmp_path / "long.jsonl"
+        with open(jsonl_file, "w", encoding="utf-8") as f:
+            f.write('{"_meta": true, "platform": "chatgpt"}\n')
+            for _ in range(3):
+                f.write(json.dumps({"role": "user", "content": long_content}) + "\n")
+
+        metadata, messages, artifacts = load_jsonl(jsonl_file)
+
+        assert len(messages) == 3
+        assert all(m["content"] == long_content for m in messages)
+
     def test_utf8_encoding(self, tmp_path):
         """Test that UTF-8 encoding is handled correctly."""
         jsonl_file = tmp_path / "utf8.jsonl"
@@ -203,3 +245,36 @@ class TestLoadJsonlArtifacts:
 
         assert artifacts[0]["language"] == "python"
         assert artifacts[0]["identifier"] == "abc123"
+
+
+class TestLoadJsonlBatch:
+    """Tests for load_jsonl_batch."""
+
+    def _write(self, path, platform, content):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"_meta": True, "platform": platform}) + "\n")
+            f.write(json.dumps({"role": "user", "content": content}) + "\n")
+
+    def test_results_in_input_order(self, tmp_path):
+        """Test that results match load_jsonl and keep input order."""
+        paths = []
+        for i, platform in enumerate(["chatgpt", "claude", "gemini", "grok"]):
+            path = tmp_path / f"{platform}.jsonl"
+            self._write(path, platform, f"질문 {i}")
+            paths.append(path)
+
+        results = load_jsonl_batch(paths, max_workers=4)
+
+        assert results == [load_jsonl(path) for path in paths]
+
+    def test_empty_list(self):
+        """Test that an empty path list returns no results."""
+        assert load_jsonl_batch([]) == []
+
+    def test_error_propagates(self, tmp_path):
+        """Test that a failure in any file is raised to the caller."""
+        good = tmp_path / "good.jsonl"
+        self._write(good, "chatgpt", "hi")
+
+        with pytest.raises(FileNotFoundError):
+            load_jsonl_batch([good, tmp_path / "missing.jsonl"])
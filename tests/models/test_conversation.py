@@ -1,5 +1,6 @@
 """Tests for conversation data models."""
 
+import pickle
 from datetime import datetime
 
 import pytest
@@ -368,3 +369,43 @@ class TestArtifactIR:
         assert "version" not in result
         assert result["title"] == "Test"
         assert result["content"] == "body"
+
+
+class TestModelSlots:
+    """Tests for slotted model dataclasses."""
+
+    def test_message_ir_has_no_instance_dict(self):
+        """Test that MessageIR uses __slots__ instead of a per-instance dict."""
+        message = MessageIR(
+            id="m0000",
+            index=0,
+            role="user",
+            timestamp=datetime(2025, 11, 29, 10, 0, 0),
+            raw_content="Hello",
+        )
+
+        assert not hasattr(message, "__dict__")
+        with pytest.raises(AttributeError):
+            message.extra = "value"
+
+    def test_conversation_ir_pickle_roundtrip(self):
+        """Test that slotted models still pickle (used by parallel parsing)."""
+        conversation = ConversationIR(
+            platform="claude",
+            conversation_id="conv",
+            meta={"url": "https://claude.ai/chat/conv"},
+            messages=[
+                MessageIR(
+                    id="m0000",
+                    index=0,
+                    role="user",
+                    timestamp=datetime(2025, 11, 29, 10, 0, 0),
+                    raw_content="Hello",
+                )
+            ],
+            artifacts=[ArtifactIR(id="a0000", title="Doc", content="x")],
+        )
+
+        restored = pickle.loads(pickle.dumps(conversation))
+
+        assert restored == conversation
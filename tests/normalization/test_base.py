@@ -168,6 +168,29 @@ class TestPassRunner:
         result = runner.run("already long enough")
         assert result == "already long enough"
 
+    def test_idempotent_pass_runs_once(self):
+        """Idempotent passes skip the confirming convergence iteration."""
+
+        class CountingPass(UppercasePass):
+            idempotent = True
+
+            def __init__(self) -> None:
+                self.calls = 0
+
+            def action(self, text: str, ctx: NormalizationContext) -> str:
+                self.calls += 1
+                return super().action(text, ctx)
+
+        pass_ = CountingPass()
+        result = PassRunner([pass_]).run("hello")
+
+        assert result == "HELLO"
+        assert pass_.calls == 1
+
+    def test_passes_not_idempotent_by_default(self):
+        """Passes run to convergence unless they opt in."""
+        assert AppendXPass.idempotent is False
+
     def test_pre_condition_skips_pass(self):
         """Pass should be skipped if pre_condition returns False."""
         runner = PassRunner([ConditionalPass()])
@@ -39,3 +39,10 @@ class TestNormalizationContext:
         ctx2 = NormalizationContext()
         ctx1.code_blocks.append("block1")
         assert ctx2.code_blocks == []
+
+    def test_has_no_instance_dict(self):
+        """Context should use __slots__ instead of a per-instance dict."""
+        ctx = NormalizationContext()
+        assert not hasattr(ctx, "__dict__")
+        with pytest.raises(AttributeError):
+            ctx.extra = "value"
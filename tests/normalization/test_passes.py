@@ -58,6 +58,23 @@ class TestCodeBlockProtectionPass:
         result = pass_.action(text, ctx)
         assert len(ctx.code_blocks) == 3
 
+    def test_fence_takes_precedence_over_inline(self):
+        """A stray backtick before a fence must not swallow its opening."""
+        pass_ = CodeBlockProtectionPass()
+        ctx = NormalizationContext()
+        text = "a ` stray ```python\ncode\n```"
+        result = pass_.action(text, ctx)
+        assert ctx.code_blocks == ["```python\ncode\n```"]
+        assert result == "a ` stray \x00CODE_BLOCK_0\x00"
+
+    def test_inline_before_unclosed_fence_run(self):
+        """Inline code may close on backticks that do not open a fence."""
+        pass_ = CodeBlockProtectionPass()
+        ctx = NormalizationContext()
+        text = "use `x```"
+        pass_.action(text, ctx)
+        assert ctx.code_blocks == ["`x`"]
+
     def test_normalizes_extra_backticks(self):
         """4+ backticks should become 3."""
         pass_ = CodeBlockProtectionPass()
@@ -77,6 +94,15 @@ class TestCodeBlockProtectionPass:
         # Bad: raw ``` still in text (outside placeholder)
         assert pass_.post_condition("```still here```", ctx) is False
 
+    def test_post_condition_ignores_many_placeholders(self):
+        pass_ = CodeBlockProtectionPass()
+        ctx = NormalizationContext()
+        text = " ".join(f"`c{i}`" for i in range(50)) + "\n```\nblock\n```"
+        result = pass_.action(text, ctx)
+        assert len(ctx.code_blocks) == 51
+        assert pass_.post_condition(result, ctx) is True
+        assert pass_.post_condition(result + " ```", ctx) is False
+
 
 class TestUnicodeNormalizationPass:
     """Test UnicodeNormalizationPass."""
@@ -85,6 +111,12 @@ class TestUnicodeNormalizationPass:
         pass_ = UnicodeNormalizationPass()
         assert pass_.name == "UnicodeNormalization"
 
+    def test_pre_condition_false_for_ascii(self):
+        pass_ = UnicodeNormalizationPass()
+        ctx = NormalizationContext()
+        assert pass_.pre_condition("plain ascii", ctx) is False
+        assert pass_.pre_condition("한글", ctx) is True
+
     def test_normalizes_nfc(self):
         pass_ = UnicodeNormalizationPass()
         ctx = NormalizationContext()
@@ -120,6 +152,12 @@ class TestListStructurePass:
         ctx = NormalizationContext()
         assert pass_.pre_condition("1. item", ctx) is True
 
+    def test_pre_condition_false_with_digits_but_no_numbered_item(self):
+        pass_ = ListStructurePass()
+        ctx = NormalizationContext()
+        assert pass_.pre_condition("version 2 of 10", ctx) is False
+        assert pass_.pre_condition("see 3.14", ctx) is True
+
     def test_pre_condition_false_no_list(self):
         pass_ = ListStructurePass()
         ctx = NormalizationContext()
@@ -203,6 +241,18 @@ class TestListStructurePass:
         result = pass_.action(text, ctx)
         assert "    1. item" in result
 
+    def test_indent_dash_block_after_numbered(self):
+        pass_ = ListStructurePass()
+        text = "1. First\n\n- a\n    - b\n2. Second"
+        result = pass_._indent_dash_block_after_numbered(text)
+        assert result == "1. First\n    - a\n        - b\n2. Second"
+
+    def test_indent_dash_block_keeps_final_newline(self):
+        pass_ = ListStructurePass()
+        text = "1. First\n" + "- item\n" * 1000
+        result = pass_._indent_dash_block_after_numbered(text)
+        assert result == "1. First\n" + "    - item\n" * 1000
+
     def test_post_condition_no_double_dash(self):
         pass_ = ListStructurePass()
         ctx = NormalizationContext()
@@ -254,6 +304,13 @@ class TestTableStructurePass:
         result = pass_.action(text, ctx)
         assert result == "| row1 |\n| row2 |"
 
+    def test_removes_blank_lines_between_consecutive_rows_in_one_call(self):
+        pass_ = TableStructurePass()
+        ctx = NormalizationContext()
+        text = "| row1 |\n\n| row2 |\n\n\n| row3 |"
+        result = pass_.action(text, ctx)
+        assert result == "| row1 |\n| row2 |\n| row3 |"
+
     def test_adds_blank_line_before_table(self):
         pass_ = TableStructurePass()
         ctx = NormalizationContext()
@@ -283,6 +340,13 @@ class TestLineContinuationPass:
         pass_ = LineContinuationPass()
         assert pass_.name == "LineContinuation"
 
+    def test_pre_condition_requires_indented_line(self):
+        from chatweave.normalization.passes import LineContinuationPass
+        pass_ = LineContinuationPass()
+        ctx = NormalizationContext()
+        assert pass_.pre_condition("line one\n continuation", ctx) is True
+        assert pass_.pre_condition("line one\nline two", ctx) is False
+
     def test_merges_line_continuation(self):
         """1-3 space continuation should join to previous line."""
         from chatweave.normalization.passes import LineContinuationPass
@@ -318,6 +382,21 @@ class TestWhitespacePass:
         pass_ = WhitespacePass()
         assert pass_.name == "Whitespace"
 
+    def test_pre_condition_false_for_tidy_text(self):
+        pass_ = WhitespacePass()
+        ctx = NormalizationContext()
+        assert pass_.pre_condition("one line\n\ntwo\n- item", ctx) is False
+        assert pass_.pre_condition("", ctx) is False
+
+    def test_pre_condition_true_when_rewrite_possible(self):
+        pass_ = WhitespacePass()
+        ctx = NormalizationContext()
+        assert pass_.pre_condition("a  b", ctx) is True
+        assert pass_.pre_condition("a\n\tb", ctx) is True
+        assert pass_.pre_condition("a\n\n\nb", ctx) is True
+        assert pass_.pre_condition(" a", ctx) is True
+        assert pass_.pre_condition("a\n", ctx) is True
+
     def test_collapses_multiple_spaces(self):
         pass_ = WhitespacePass()
         ctx = NormalizationContext()
@@ -325,6 +404,20 @@ class TestWhitespacePass:
         result = pass_.action(text, ctx)
         assert result == "word word"
 
+    def test_collapses_spaces_only_after_non_whitespace(self):
+        pass_ = WhitespacePass()
+        ctx = NormalizationContext()
+        text = "a  b\t  c\n\n\n   - item"
+        result = pass_.action(text, ctx)
+        assert result == "a b\t  c\n\n   - item"
+
+    def test_collapses_deep_indent_and_indent_after_blank(self):
+        pass_ = WhitespacePass()
+        ctx = NormalizationContext()
+        text = "line1\n      deep\n\n    after blank"
+        result = pass_.action(text, ctx)
+        assert result == "line1\n deep\n\n after blank"
+
     def test_preserves_leading_indent(self):
         """Leading indent in middle of text should be preserved."""
         pass_ = WhitespacePass()
@@ -340,6 +433,13 @@ class TestWhitespacePass:
         result = pass_.action(text, ctx)
         assert "\n   \n" not in result
 
+    def test_removes_consecutive_whitespace_only_lines_in_one_call(self):
+        pass_ = WhitespacePass()
+        ctx = NormalizationContext()
+        text = "line1\n \n\t\n  \nline2"
+        result = pass_.action(text, ctx)
+        assert result == "line1\nline2"
+
     def test_collapses_multiple_newlines(self):
         pass_ = WhitespacePass()
         ctx = NormalizationContext()
@@ -368,6 +468,13 @@ class TestEscapeSequencePass:
         pass_ = EscapeSequencePass()
         assert pass_.name == "EscapeSequence"
 
+    def test_pre_condition_requires_backslash_or_smart_quote(self):
+        pass_ = EscapeSequencePass()
+        ctx = NormalizationContext()
+        assert pass_.pre_condition("\\*\\*bold\\*\\*", ctx) is True
+        assert pass_.pre_condition("\u201cquoted\u201d", ctx) is True
+        assert pass_.pre_condition("# Section 1. Title", ctx) is False
+
     def test_unescapes_bold_markers(self):
         pass_ = EscapeSequencePass()
         ctx = NormalizationContext()
@@ -404,6 +511,25 @@ class TestEscapeSequencePass:
         # Should preserve escapes outside headings
         assert "\\." in result
 
+    def test_unescapes_all_heading_escapes_in_one_call(self):
+        pass_ = EscapeSequencePass()
+        ctx = NormalizationContext()
+        text = "# 1\\. 2\\. \\[note\\]\nbody 3\\."
+        result = pass_.action(text, ctx)
+        assert result == "# 1. 2. [note]\nbody 3\\."
+
+    def test_not_idempotent_for_stacked_backslashes(self):
+        """Each action strips one backslash before '.', so it needs convergence."""
+        pass_ = EscapeSequencePass()
+        ctx = NormalizationContext()
+        text = "# 1\\\\. Title"
+
+        once = pass_.action(text, ctx)
+
+        assert once == "# 1\\. Title"
+        assert pass_.action(once, ctx) == "# 1. Title"
+        assert EscapeSequencePass.idempotent is False
+
     def test_post_condition_no_smart_quotes(self):
         pass_ = EscapeSequencePass()
         ctx = NormalizationContext()
@@ -445,6 +571,29 @@ class TestCodeBlockRestorationPass:
         result = pass_.action(text, ctx)
         assert result == "`a` and `b`"
 
+    def test_restores_double_digit_index(self):
+        pass_ = CodeBlockRestorationPass()
+        ctx = NormalizationContext()
+        ctx.code_blocks = [f"`{i}`" for i in range(12)]
+        text = "\x00CODE_BLOCK_11\x00 \x00CODE_BLOCK_1\x00"
+        result = pass_.action(text, ctx)
+        assert result == "`11` `1`"
+
+    def test_leaves_unknown_placeholder(self):
+        pass_ = CodeBlockRestorationPass()
+        ctx = NormalizationContext()
+        ctx.code_blocks = ["`a`"]
+        text = "\x00CODE_BLOCK_0\x00 \x00CODE_BLOCK_7\x00"
+        result = pass_.action(text, ctx)
+        assert result == "`a` \x00CODE_BLOCK_7\x00"
+
+    def test_restores_custom_placeholder_base(self):
+        pass_ = CodeBlockRestorationPass()
+        ctx = NormalizationContext(placeholder_base="[[CB.{}]]")
+        ctx.code_blocks = ["`a`"]
+        result = pass_.action("x [[CB.0]] y", ctx)
+        assert result == "x `a` y"
+
     def test_post_condition_no_placeholders(self):
         pass_ = CodeBlockRestorationPass()
         ctx = NormalizationContext()
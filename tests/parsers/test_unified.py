@@ -1,6 +1,8 @@
 """Tests for conversation parsers."""
 
 import json
+import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
@@ -180,3 +182,82 @@ class TestUnifiedParser:
         artifact = conversation_ir.artifacts[0]
         assert artifact.meta["language"] == "python"
         assert artifact.meta["identifier"] == "abc"
+        assert artifact.meta == {"language": "python", "identifier": "abc"}
+        assert artifact.version is None
+
+    def test_convert_artifact_leaves_input_untouched(self):
+        """Test that known fields are removed from meta, not from the input."""
+        parser = UnifiedParser()
+        data = {"title": "T", "version": "v1", "content": "c", "language": "go"}
+
+        artifact = parser._convert_artifact(data, 3)
+
+        assert artifact.id == "a0003"
+        assert artifact.meta == {"language": "go"}
+        assert data == {"title": "T", "version": "v1", "content": "c", "language": "go"}
+
+    def test_convert_artifact_missing_fields_default(self):
+        """Test defaults when title and content are absent."""
+        artifact = UnifiedParser()._convert_artifact({}, 0)
+
+        assert artifact.title == ""
+        assert artifact.content == ""
+        assert artifact.version is None
+        assert artifact.meta == {}
+
+    def test_parser_reused_across_platforms(self, tmp_path):
+        """Test that one parser instance applies per-platform cleaning per file."""
+        parser = UnifiedParser()
+        contents = {}
+        for platform, answer in [
+            ("gemini", "생각하는 과정 표시\n\nAnswer"),
+            ("grok", "5s동안 생각함\n\nAnswer"),
+            ("claude", "Answer"),
+        ]:
+            jsonl_file = tmp_path / f"{platform}_x.jsonl"
+            with open(jsonl_file, "w", encoding="utf-8") as f:
+                f.write(f'{{"_meta": true, "platform": "{platform}"}}\n')
+                f.write('{"role": "user", "content": "Q"}\n')
+                f.write(json.dumps({"role": "assistant", "content": answer}) + "\n")
+            contents[platform] = parser.parse(jsonl_file).messages[1].normalized_content
+
+        assert contents == {"gemini": "Answer", "grok": "Answer", "claude": "Answer"}
+
+    def test_roles_and_platform_are_interned(self, tmp_path):
+        """Test that role and platform strings are shared across objects."""
+        jsonl_file = tmp_path / "export.jsonl"
+        with open(jsonl_file, "w", encoding="utf-8") as f:
+            f.write('{"_meta": true, "platform": "claude"}\n')
+            for _ in range(2):
+                f.write('{"role": "user", "content": "Q"}\n')
+                f.write('{"role": "assistant", "content": "A"}\n')
+
+        conversation_ir = UnifiedParser().parse(jsonl_file)
+
+        roles = [msg.role for msg in conversation_ir.messages]
+        assert roles == ["user", "assistant", "user", "assistant"]
+        assert roles[0] is roles[2] is sys.intern("user")
+        assert roles[1] is roles[3] is sys.intern("assistant")
+        assert conversation_ir.platform is sys.intern("claude")
+
+    @pytest.mark.parametrize(
+        "timestamp, expected",
+        [
+            ('"2025-11-29T10:00:00Z"', datetime(2025, 11, 29, 10, 0, tzinfo=timezone.utc)),
+            ('"2025-11-29T19:00:00+09:00"', datetime(2025, 11, 29, 10, 0, tzinfo=timezone.utc)),
+            ('""', datetime.fromtimestamp(0)),
+            ("null", datetime.fromtimestamp(0)),
+            ("12345", datetime.fromtimestamp(0)),
+            ('"not a date"', datetime.fromtimestamp(0)),
+        ],
+    )
+    def test_timestamp_parsing(self, tmp_path, timestamp, expected):
+        """Test that timestamps parse, falling back to epoch when invalid."""
+        jsonl_file = tmp_path / "chatgpt_ts.jsonl"
+        with open(jsonl_file, "w", encoding="utf-8") as f:
+            f.write('{"_meta": true, "platform": "chatgpt"}\n')
+            f.write(f'{{"role": "user", "content": "Q", "timestamp": {timestamp}}}\n')
+
+        message = UnifiedParser().parse(jsonl_file).messages[0]
+
+        assert message.timestamp == expected
@@ -464,3 +464,45 @@ class TestBuildQAIR:
         assert len(qa_ir.qa_units) == 1
         # Empty content should result in None (no content to join)
         assert qa_ir.qa_units[0].question_from_user is None
+
+    def test_mixed_empty_user_content(self):
+        """Test that empty user messages keep their IDs but add no content."""
+        timestamp = datetime(2025, 11, 29, 10, 0, 0)
+        messages = [
+            MessageIR(
+                id="m0000",
+                index=0,
+                role="user",
+                timestamp=timestamp,
+                raw_content="",
+                query_hash=""
+            ),
+            MessageIR(
+                id="m0001",
+                index=1,
+                role="user",
+                timestamp=timestamp,
+                raw_content="Real question"
+            ),
+            MessageIR(
+                id="m0002",
+                index=2,
+                role="assistant",
+                timestamp=timestamp,
+                raw_content="Answer"
+            )
+        ]
+
+        conversation = ConversationIR(
+            platform="claude",
+            conversation_id="test",
+            meta={},
+            messages=messages
+        )
+
+        qa_ir = build_qa_ir(conversation)
+
+        qa1 = qa_ir.qa_units[0]
+        assert qa1.user_message_ids == ["m0000", "m0001"]
+        assert qa1.question_from_user == "Real question"
+        assert qa1.user_query_hash is None
@@ -391,3 +391,41 @@ class TestBuildSessionIR:
         assert len(session_ir.prompts) == 10
         for i, prompt in enumerate(session_ir.prompts):
             assert prompt.prompt_key == f"p{i:04d}"
+
+    def test_missing_context_flag(self):
+        """Test missing_context when a platform lacks the dependent QA unit."""
+
+        def unit(platform, i, query_hash):
+            return QAUnit(
+                qa_id=f"q{i:04d}",
+                platform=platform,
+                conversation_id=f"{platform}-conv",
+                user_message_ids=[f"m{i*2:04d}"],
+                assistant_message_ids=[f"m{i*2+1:04d}"],
+                question_from_user=f"Question {query_hash}",
+                user_query_hash=query_hash,
+            )
+
+        qa_units_dict = {
+            "chatgpt": QAUnitIR(
+                platform="chatgpt",
+                conversation_id="chatgpt-conv",
+                qa_units=[unit("chatgpt", i, f"hash{i}") for i in range(3)],
+            ),
+            "claude": QAUnitIR(
+                platform="claude",
+                conversation_id="claude-conv",
+                qa_units=[unit("claude", 0, "hash2")],
+            ),
+        }
+
+        session_ir = build_session_ir(qa_units_dict, "test-session")
+
+        last_prompt = session_ir.prompts[2]
+        assert last_prompt.depends_on == ["p0001"]
+        refs = {ref.platform: ref for ref in last_prompt.per_platform}
+        assert refs["chatgpt"].missing_context is False
+        assert refs["claude"].missing_context is True
+        assert all(
+            ref.missing_context is False for ref in session_ir.prompts[0].per_platform
+        )
@@ -1,5 +1,6 @@
 """Tests for CLI functionality."""
 
+import json
 import sys
 from pathlib import Path
 
@@ -152,6 +153,21 @@ class TestBuildIRCommand:
 
         assert excinfo.value.code == 2
 
+    @pytest.mark.parametrize("jobs", ["0", "-2", "two"])
+    def test_build_ir_rejects_invalid_jobs(self, jobs, tmp_path, monkeypatch, capsys):
+        """Test that --jobs below 1 or non-integer causes an argparse error."""
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["chatweave", "build-ir", str(tmp_path), f"--jobs={jobs}"]
+        )
+
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+
+        assert excinfo.value.code == 2
+        assert "--jobs" in capsys.readouterr().err
+
     def test_build_ir_single_file_input(self, sample_session_dir, tmp_path, monkeypatch):
         """Test processing a single JSONL file."""
         output_dir = tmp_path / "ir"
@@ -377,3 +393,181 @@ class TestBuildIRCommand:
         # Verify SessionIR file was created (default behavior)
         session_ir_file = output_dir / "session-ir" / "mms_sample-session.json"
         assert session_ir_file.exists()
+
+    def test_build_ir_jobs_option_matches_parallel_output(
+        self, sample_session_dir, tmp_path, monkeypatch
+    ):
+        """Test that sequential (--jobs 1) and parallel parsing agree."""
+        outputs = {}
+        for jobs in ["1", "4"]:
+            output_dir = tmp_path / f"ir-{jobs}"
+            monkeypatch.setattr(
+                sys,
+                "argv",
+                [
+                    "chatweave", "build-ir", str(sample_session_dir),
+                    "--output", str(output_dir), "--jobs", jobs,
+                ],
+            )
+            main()
+            session_ir_file = output_dir / "session-ir" / "mms_sample-session.json"
+            outputs[jobs] = session_ir_file.read_text(encoding="utf-8")
+
+        assert outputs["1"] == outputs["4"]
+
+    def test_build_ir_pretty_option(self, sample_session_dir, tmp_path, monkeypatch):
+        """Test that output is compact by default and indented with --pretty."""
+        contents = {}
+        for name, extra in [("compact", []), ("pretty", ["--pretty"])]:
+            output_dir = tmp_path / name
+            monkeypatch.setattr(
+                sys,
+                "argv",
+                ["chatweave", "build-ir", str(sample_session_dir), "--output", str(output_dir)]
+                + extra,
+            )
+            main()
+            session_ir_file = output_dir / "session-ir" / "mms_sample-session.json"
+            contents[name] = session_ir_file.read_text(encoding="utf-8")
+
+        assert "\n" not in contents["compact"]
+        assert contents["pretty"].startswith('{\n  "schema"')
+        assert json.loads(contents["compact"]) == json.loads(contents["pretty"])
+
+    def test_build_ir_verbose_summary_lists_prompts(
+        self, sample_session_dir, tmp_path, monkeypatch, capsys
+    ):
+        """Test that the verbose summary lists every prompt and platform ref."""
+        output_dir = tmp_path / "ir"
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["chatweave", "build-ir", str(sample_session_dir), "--output", str(output_dir), "--verbose"]
+        )
+
+        main()
+
+        out = capsys.readouterr().out
+        summary = out[out.index("=== Summary ==="):]
+        data = json.loads(
+            (output_dir / "session-ir" / "mms_sample-session.json").read_text(encoding="utf-8")
+        )
+        assert summary.count("Canonical:") == len(data["prompts"])
+        assert summary.count("(similarity:") == sum(
+            len(p["per_platform"]) for p in data["prompts"]
+        )
+
+
+class TestCollectJsonlFiles:
+    """Test cases for _collect_jsonl_files helper."""
+
+    def test_collects_only_jsonl_files_from_directory(self, tmp_path):
+        """Test that only regular *.jsonl files (dotfiles included) are collected."""
+        from chatweave.cli import _collect_jsonl_files
+
+        (tmp_path / "chatgpt_a.jsonl").write_text("{}")
+        (tmp_path / "claude_b.jsonl").write_text("{}")
+        (tmp_path / "notes.txt").write_text("")
+        (tmp_path / ".hidden.jsonl").write_text("{}")
+        (tmp_path / "nested.jsonl").mkdir()
+
+        files = _collect_jsonl_files([tmp_path])
+
+        assert sorted(f.name for f in files) == [
+            ".hidden.jsonl",
+            "chatgpt_a.jsonl",
+            "claude_b.jsonl",
+        ]
+        assert all(f.is_absolute() for f in files)
+
+    def test_relative_file_input_is_resolved(self, tmp_path, monkeypatch):
+        """Test that relative file inputs are returned as absolute paths."""
+        from chatweave.cli import _collect_jsonl_files
+
+        (tmp_path / "chatgpt_a.jsonl").write_text("{}")
+        monkeypatch.chdir(tmp_path)
+
+        files = _collect_jsonl_files([Path("chatgpt_a.jsonl")])
+
+        assert files == [tmp_path / "chatgpt_a.jsonl"]
+
+    def test_non_jsonl_file_exits(self, tmp_path, capsys):
+        """Test that a non-JSONL file input causes exit(1)."""
+        from chatweave.cli import _collect_jsonl_files
+
+        text_file = tmp_path / "notes.txt"
+        text_file.write_text("")
+
+        with pytest.raises(SystemExit) as excinfo:
+            _collect_jsonl_files([text_file])
+
+        assert excinfo.value.code == 1
+        assert "Error: Not a JSONL file" in capsys.readouterr().err
+
+
+class TestLazyImports:
+    """Test cases for CLI startup imports."""
+
+    def test_cli_import_does_not_load_pipeline(self):
+        """Test that importing the CLI defers parser/pipeline/writer modules."""
+        import subprocess
+
+        code = (
+            "import sys, chatweave.cli; "
+            "heavy = ['chatweave.parsers.unified', 'chatweave.pipeline', "
+            "'chatweave.io.ir_writer', 'chatweave.normalization']; "
+            "print(','.join(m for m in heavy if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == ""
+
+
+class TestWriteConversationIRs:
+    """Test cases for _write_conversation_irs helper."""
+
+    def test_preserves_order_and_duplicate_suffixes(self, tmp_path):
+        """Test that parallel writes keep input order and serial suffixing."""
+        from chatweave.cli import _write_conversation_irs
+        from chatweave.models.conversation import ConversationIR
+
+        conversation_irs = [
+            ConversationIR(platform=platform, conversation_id=conv_id, meta={"n": n}, messages=[])
+            for n, (platform, conv_id) in enumerate(
+                [("chatgpt", "a"), ("claude", "b"), ("chatgpt", "a"), ("gemini", "c"), ("chatgpt", "a")]
+            )
+        ]
+
+        written = _write_conversation_irs(conversation_irs, tmp_path)
+
+        assert [p.name for p in written] == [
+            "chatgpt_conv_a.json",
+            "claude_conv_b.json",
+            "chatgpt_conv_a_1.json",
+            "gemini_conv_c.json",
+            "chatgpt_conv_a_2.json",
+        ]
+        for n, path in enumerate(written):
+            assert json.loads(path.read_text(encoding="utf-8"))["meta"] == {"n": n}
+
+    def test_suffix_collision_across_conversation_ids(self, tmp_path):
+        """Test that a suffixed name never overwrites another conversation's file."""
+        from chatweave.cli import _write_conversation_irs
+        from chatweave.models.conversation import ConversationIR
+
+        conversation_irs = [
+            ConversationIR(platform="chatgpt", conversation_id=conv_id, meta={"n": n}, messages=[])
+            for n, conv_id in enumerate(["a", "a", "a_1"])
+        ]
+
+        written = _write_conversation_irs(conversation_irs, tmp_path)
+
+        assert [p.name for p in written] == [
+            "chatgpt_conv_a.json",
+            "chatgpt_conv_a_1.json",
+            "chatgpt_conv_a_1_1.json",
+        ]
+        for n, path in enumerate(written):
+            assert json.loads(path.read_text(encoding="utf-8"))["meta"] == {"n": n}
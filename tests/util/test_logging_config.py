@@ -0,0 +1,52 @@
+"""Tests for logging configuration."""
+
+import logging
+
+from chatweave.util.logging_config import setup_logging
+
+
+class TestSetupLogging:
+    """Test cases for setup_logging."""
+
+    def test_console_handler_by_default(self):
+        """Should install a single console handler at INFO level."""
+        logger = setup_logging()
+
+        assert len(logger.handlers) == 1
+        assert logger.handlers[0].level == logging.INFO
+        assert logger.propagate is False
+
+    def test_quiet_without_file_has_no_handlers(self):
+        """Should install no handlers when quiet and no log file."""
+        logger = setup_logging(quiet=True)
+
+        assert logger.handlers == []
+
+    def test_repeated_identical_call_keeps_handlers(self):
+        """Should reuse handlers when called again with the same config."""
+        first = list(setup_logging(verbose=True).handlers)
+        second = list(setup_logging(verbose=True).handlers)
+
+        assert first == second
+
+    def test_changed_config_rebuilds_handlers(self, tmp_path):
+        """Should replace handlers and close the old log file on config change."""
+        log_file = tmp_path / "logs" / "app.log"
+        logger = setup_logging(quiet=True, log_file=log_file)
+        file_handler = logger.handlers[0]
+        assert isinstance(file_handler, logging.FileHandler)
+
+        logger = setup_logging(verbose=True)
+
+        assert file_handler not in logger.handlers
+        assert file_handler.stream is None
+        assert logger.handlers[0].level == logging.DEBUG
+
+    def test_handlers_removed_externally_are_restored(self):
+        """Should rebuild when the logger no longer has the installed handlers."""
+        logger = setup_logging()
+        logger.handlers.clear()
+
+        logger = setup_logging()
+
+        assert len(logger.handlers) == 1
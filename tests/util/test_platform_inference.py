@@ -46,6 +46,20 @@ class TestInferPlatformFromFilename:
         """Should match grok-* pattern."""
         assert infer_platform_from_filename("grok-export.jsonl") == "grok"
 
+    def test_perplexity_pattern_underscore(self):
+        """Should match perplexity_* pattern."""
+        assert infer_platform_from_filename("perplexity_20251206T133524.jsonl") == "perplexity"
+
+    def test_mixed_case_returns_lowercase_platform(self):
+        """Should return the lowercase platform name for mixed-case prefixes."""
+        assert infer_platform_from_filename("GROK-export.jsonl") == "grok"
+        assert infer_platform_from_filename("Perplexity_x.jsonl") == "perplexity"
+
+    def test_platform_prefix_must_be_whole_word(self):
+        """Should not match a longer word that starts with a platform name."""
+        assert infer_platform_from_filename("claudette_x.jsonl") is None
+        assert infer_platform_from_filename("xclaude_x.jsonl") is None
+
     def test_no_match_returns_none(self):
         """Should return None for unknown filename."""
         assert infer_platform_from_filename("unknown.jsonl") is None
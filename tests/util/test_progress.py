@@ -202,3 +202,115 @@ class TestProgressTracker:
 
         # Check schema version
         assert data["schema"] == "progress/v1"
+
+    def test_buffered_appends_events_until_complete(self, tmp_path):
+        """Should append step events and rewrite progress.json only on complete."""
+        tracker = ProgressTracker(output_dir=tmp_path, enabled=True, buffered=True)
+        tracker.set_input("directory", "/path/to/session", ["file1.jsonl"])
+        tracker.start_step("parse", details={"files": 1})
+        tracker.complete_step("parse")
+
+        progress_file = tmp_path / "progress.json"
+        log_file = tmp_path / "progress.log.jsonl"
+        with open(progress_file, encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["status"] == "in_progress"
+        assert data["steps"][0]["status"] == "pending"
+
+        events = [
+            json.loads(line)
+            for line in log_file.read_text(encoding="utf-8").splitlines()
+        ]
+        assert [e["event"] for e in events] == ["set_input", "start_step", "complete_step"]
+        assert events[1]["step"] == "parse"
+        assert events[1]["details"] == {"files": 1}
+
+        tracker.complete({"session_ir": "/output/session.json"})
+
+        with open(progress_file, encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["status"] == "completed"
+        assert data["steps"][0]["status"] == "completed"
+
+    def test_buffered_new_run_replaces_previous_state(self, tmp_path):
+        """Should truncate the event log and mark progress.json in progress."""
+        previous = ProgressTracker(output_dir=tmp_path, enabled=True, buffered=True)
+        previous.set_input("file", "/old.jsonl", ["old.jsonl"])
+        previous.start_step("parse")
+        previous.complete({})
+
+        tracker = ProgressTracker(output_dir=tmp_path, enabled=True, buffered=True)
+        tracker.set_input("file", "/new.jsonl", ["new.jsonl"])
+
+        with open(tmp_path / "progress.json", encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["status"] == "in_progress"
+        assert data["input"]["path"] == "/new.jsonl"
+        lines = (tmp_path / "progress.log.jsonl").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["event"] for line in lines] == ["set_input"]
+
+    def test_buffered_fail_writes_progress_file(self, tmp_path):
+        """Should write progress.json on failure in buffered mode."""
+        tracker = ProgressTracker(output_dir=tmp_path, enabled=True, buffered=True)
+        tracker.start_step("parse")
+        tracker.fail("boom")
+
+        with open(tmp_path / "progress.json", encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["status"] == "error"
+        assert data["error"] == "boom"
+
+    def test_buffered_disabled_writes_nothing(self, tmp_path):
+        """Should not write any file when disabled in buffered mode."""
+        tracker = ProgressTracker(output_dir=tmp_path, enabled=False, buffered=True)
+        tracker.start_step("parse")
+        tracker.complete({})
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_write_leaves_no_temp_file(self, tmp_path):
+        """Should replace progress.json atomically without leaving a temp file."""
+        tracker = ProgressTracker(output_dir=tmp_path, enabled=True)
+        tracker.start_step("parse")
+        tracker.complete({})
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["progress.json"]
+
+    def test_min_write_interval_debounces_updates(self, tmp_path):
+        """Should skip intermediate rewrites within min_write_interval."""
+        tracker = ProgressTracker(output_dir=tmp_path, enabled=True, min_write_interval=60)
+        tracker.set_input("file", "/path/to/file.jsonl", ["file.jsonl"])
+        tracker.start_step("parse")
+
+        with open(tmp_path / "progress.json", encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["status"] == "pending"
+        assert data["steps"][0]["status"] == "pending"
+
+    def test_min_write_interval_complete_always_writes(self, tmp_path):
+        """Should write final state on complete even within the interval."""
+        tracker = ProgressTracker(output_dir=tmp_path, enabled=True, min_write_interval=60)
+        tracker.set_input("file", "/path/to/file.jsonl", ["file.jsonl"])
+        tracker.start_step("parse")
+        tracker.complete({"session_ir": "/output/session.json"})
+
+        with open(tmp_path / "progress.json", encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["status"] == "completed"
+        assert data["steps"][0]["status"] == "in_progress"
+
+    def test_stdlib_fallback_layout_matches(self, tmp_path, monkeypatch):
+        """Should write byte-identical progress.json with and without orjson."""
+        import chatweave.util.progress as progress
+
+        tracker = ProgressTracker(output_dir=tmp_path, enabled=False)
+        tracker.set_input("files", "/경로/session", ["a.jsonl", "b.jsonl"])
+        tracker.start_step("parse", details={"files": 2, "platforms": ["chatgpt"]})
+        data = {"steps": [step.to_dict() for step in tracker.steps], "output": {}}
+
+        default = progress._dumps(data, indent=True)
+        monkeypatch.setattr(progress, "orjson", None)
+        fallback = progress._dumps(data, indent=True)
+
+        assert default == fallback
+        assert "/경로/session".encode("utf-8") in progress._dumps(tracker.input_info)
@@ -1,5 +1,9 @@
 """Tests for text normalization utilities."""
 
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
 from chatweave.util.text_normalization import (
@@ -20,6 +24,21 @@ class TestNormalizeText:
         """Test that None is returned as-is."""
         assert normalize_text(None) is None
 
+    def test_normalization_package_imported_lazily(self):
+        """Test that importing chatweave.util does not load the pass pipeline."""
+        code = (
+            "import sys, chatweave.util; "
+            "print('chatweave.normalization' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parents[2],
+        )
+        assert result.stdout.strip() == "False"
+
     def test_single_space(self):
         """Test that single spaces are preserved."""
         assert normalize_text("a b c") == "a b c"
@@ -252,6 +271,16 @@ print("hello")
         result = clean_gemini_assistant(text)
         assert result == "응답 내용입니다."
 
+    def test_source_mid_text_preserved(self):
+        """Test that '소스' not at the end is left alone."""
+        text = "소스 코드를 보면\n\n소스\n\n설명이 이어집니다."
+        assert clean_gemini_assistant(text) == text
+
+    def test_text_without_artifacts_unchanged(self):
+        """Test that text without any Gemini artifacts is returned as-is."""
+        text = "생각\n\n- item\n\nSheets\n\n코드"
+        assert clean_gemini_assistant(text) is text
+
     def test_full_gemini_response_cleaning(self):
         """Test cleaning a full Gemini response with all artifacts."""
         text = """생각하는 과정 표시